@@ -1,27 +1,70 @@
+from importlib import import_module
 from importlib.metadata import version, PackageNotFoundError
+from typing import TYPE_CHECKING
 
 try:
     __version__ = version("comfy-test")
 except PackageNotFoundError:
     __version__ = "0.0.0-dev"
 
-from .common.config import TestConfig, WorkflowConfig, PlatformTestConfig
-from .common.config_file import load_config, discover_config, CONFIG_FILE_NAMES
-from .orchestration.manager import TestManager
-from .orchestration.results import TestResult
-from .common.errors import (
-    TestError,
-    ConfigError,
-    SetupError,
-    ServerError,
-    WorkflowError,
-    VerificationError,
-    TestTimeoutError,
-    DownloadError,
-)
-
-# Convenience functions
-from .runner import run_tests
+if TYPE_CHECKING:
+    from .common.config import TestConfig, WorkflowConfig, PlatformTestConfig
+    from .common.config_file import load_config, discover_config, CONFIG_FILE_NAMES
+    from .orchestration.manager import TestManager
+    from .orchestration.results import TestResult
+    from .common.errors import (
+        TestError,
+        ConfigError,
+        SetupError,
+        ServerError,
+        WorkflowError,
+        VerificationError,
+        TestTimeoutError,
+        DownloadError,
+    )
+    from .runner import run_tests
+
+# Public names are resolved on first access (PEP 562) so that `import
+# comfy_test` -- and therefore every `comfy-test` CLI invocation, which imports
+# the package before comfy_test.cli -- does not pull in the orchestration
+# layer, every platform backend and `requests` up front.
+_LAZY_EXPORTS = {
+    # Config
+    "TestConfig": ".common.config",
+    "WorkflowConfig": ".common.config",
+    "PlatformTestConfig": ".common.config",
+    "load_config": ".common.config_file",
+    "discover_config": ".common.config_file",
+    "CONFIG_FILE_NAMES": ".common.config_file",
+    # Manager
+    "TestManager": ".orchestration.manager",
+    "TestResult": ".orchestration.results",
+    # Errors
+    "TestError": ".common.errors",
+    "ConfigError": ".common.errors",
+    "SetupError": ".common.errors",
+    "ServerError": ".common.errors",
+    "WorkflowError": ".common.errors",
+    "VerificationError": ".common.errors",
+    "TestTimeoutError": ".common.errors",
+    "DownloadError": ".common.errors",
+    # Convenience
+    "run_tests": ".runner",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Config
@@ -7,15 +7,31 @@ vendor call themselves. Adding ROCm is a sibling ``RocmBackend`` (rocm-smi)
 registered in ``backends/__init__.py`` -- not an edit to any generic caller.
 
 Each method reproduces its former caller's exact query/timeout/return semantics
-so extraction is behaviour-preserving.
+so extraction is behaviour-preserving. The per-sample VRAM queries go through
+NVML (``pynvml``, from the optional ``nvml`` extra) when it is installed, which
+avoids forking nvidia-smi every second; nvidia-smi remains the fallback.
 """
 
 from __future__ import annotations
 
+import functools
 import subprocess
 
 CUDA_TORCH_INDEX = "https://download.pytorch.org/whl/cu128"
 
+_MIB = 1024 * 1024
+
+
+@functools.cache
+def _nvml():
+    """The initialised pynvml module, or None (not installed / no driver)."""
+    try:
+        import pynvml
+        pynvml.nvmlInit()
+    except Exception:
+        return None
+    return pynvml
+
 
 def _smi(args: list[str], timeout: int) -> str | None:
     """Run nvidia-smi with args; return stdout on success, None otherwise."""
@@ -54,6 +70,13 @@ class CudaBackend:
 
     # --- VRAM (was common/vram_monitor.py; timeout 10, 0/{} on failure) -------
     def total_vram_mib(self) -> int:
+        nvml = _nvml()
+        if nvml is not None:
+            try:
+                handle = nvml.nvmlDeviceGetHandleByIndex(0)
+                return nvml.nvmlDeviceGetMemoryInfo(handle).total // _MIB
+            except nvml.NVMLError:
+                pass
         out = _smi(["--query-gpu=memory.total", "--format=csv,noheader,nounits"], timeout=10)
         if not out:
             return 0
@@ -63,6 +86,12 @@ class CudaBackend:
             return 0
 
     def vram_per_pid_mib(self) -> dict[int, int]:
+        nvml = _nvml()
+        if nvml is not None:
+            try:
+                return {pid: int(mib) for pid, mib in _nvml_compute_mib(nvml).items()}
+            except nvml.NVMLError:
+                pass
         out = _smi(
             ["--query-compute-apps=pid,used_gpu_memory", "--format=csv,noheader,nounits"],
             timeout=10,
@@ -83,6 +112,13 @@ class CudaBackend:
 
     # --- VRAM (was common/resource_monitor.py; timeout 2, None on failure) ----
     def system_vram_used_mib(self) -> float | None:
+        nvml = _nvml()
+        if nvml is not None:
+            try:
+                handle = nvml.nvmlDeviceGetHandleByIndex(0)
+                return nvml.nvmlDeviceGetMemoryInfo(handle).used / _MIB
+            except nvml.NVMLError:
+                pass
         out = _smi(["--query-gpu=memory.used", "--format=csv,noheader,nounits"], timeout=2)
         if out is None:
             return None
@@ -93,6 +129,12 @@ class CudaBackend:
 
     def vram_used_by_pid_mib(self) -> dict[int, float] | None:
         """pid -> used MiB from the compute-apps query. None on query failure."""
+        nvml = _nvml()
+        if nvml is not None:
+            try:
+                return _nvml_compute_mib(nvml)
+            except nvml.NVMLError:
+                pass
         out = _smi(
             ["--query-compute-apps=pid,used_memory", "--format=csv,noheader,nounits"],
             timeout=2,
@@ -111,3 +153,15 @@ class CudaBackend:
                 except ValueError:
                     pass
         return result
+
+
+def _nvml_compute_mib(nvml) -> dict[int, float]:
+    """pid -> used MiB across all GPUs, the NVML form of --query-compute-apps."""
+    result: dict[int, float] = {}
+    for index in range(nvml.nvmlDeviceGetCount()):
+        handle = nvml.nvmlDeviceGetHandleByIndex(index)
+        for proc in nvml.nvmlDeviceGetComputeRunningProcesses(handle):
+            if proc.usedGpuMemory is None:  # nvidia-smi's "[N/A]"
+                continue
+            result[proc.pid] = result.get(proc.pid, 0.0) + proc.usedGpuMemory / _MIB
+    return result
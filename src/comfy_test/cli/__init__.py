@@ -5,44 +5,62 @@ This module provides the command-line interface for comfy-test.
 
 import argparse
 import sys
+from importlib import import_module
 
-from .run import cmd_run, add_run_parser
-from .publish import cmd_publish, add_publish_parser
-from .paths import cmd_paths, add_paths_parser
-from .coverage import cmd_coverage, add_coverage_parser
-from .generate_index import (
-    cmd_generate_index,
-    add_generate_index_parser,
+
+# Subcommand name -> (module, parser registrar), in `--help` listing order.
+# Modules are imported only when their parser is registered, so `comfy-test
+# paths` never loads the reporting or ComfyUI client code that other
+# subcommands need.
+_REGISTRARS = {
+    "run": (".run", "add_run_parser"),
+    "publish": (".publish", "add_publish_parser"),
+    "paths": (".paths", "add_paths_parser"),
+    "coverage": (".coverage", "add_coverage_parser"),
+    "generate-index": (".generate_index", "add_generate_index_parser"),
+    "settings": (".settings", "add_settings_parser"),
+    "docker": (".docker", "add_docker_parser"),
+    "sandbox": (".sandbox", "add_sandbox_parser"),
+    "vm": (".vm", "add_vm_parser"),
+}
+
+
+def _register(command: str, subparsers) -> None:
+    module, registrar = _REGISTRARS[command]
+    getattr(import_module(module, __name__), registrar)(subparsers)
+
+
+# What argparse prints for a bare `comfy-test`, without building any parser.
+_SHORT_USAGE = (
+    f"usage: comfy-test [-h] {{{','.join(_REGISTRARS)}}} ...\n"
+    "comfy-test: error: the following arguments are required: command\n"
 )
-from .settings import add_settings_parser
-from .docker import add_docker_parser
-from .sandbox import add_sandbox_parser
-from .vm import add_vm_parser
 
 
 def main(args=None) -> int:
     """Main CLI entry point."""
+    argv = sys.argv[1:] if args is None else list(args)
+    if not argv:
+        sys.stderr.write(_SHORT_USAGE)
+        return 2
     parser = argparse.ArgumentParser(
         prog="comfy-test",
         description="Installation testing for ComfyUI custom nodes",
     )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    # Register commands
-    add_run_parser(subparsers)
-    add_publish_parser(subparsers)
-    add_paths_parser(subparsers)
-    add_coverage_parser(subparsers)
-    add_generate_index_parser(subparsers)
-    add_settings_parser(subparsers)
-    add_docker_parser(subparsers)
-    add_sandbox_parser(subparsers)
-    add_vm_parser(subparsers)
+    # Register commands. The subcommand is always the first argument (there
+    # are no global options besides -h), so when it names a known command only
+    # that parser is built. Top-level help, a missing command and typos fall
+    # through to registering everything so usage/error output stays complete.
+    command = argv[0] if argv else None
+    if command in _REGISTRARS:
+        _register(command, subparsers)
+    else:
+        for name in _REGISTRARS:
+            _register(name, subparsers)
 
     # Parse and execute
-    parsed_args = parser.parse_args(args)
+    parsed_args = parser.parse_args(argv)
     return parsed_args.func(parsed_args)
 
-
-if __name__ == "__main__":
-    sys.exit(main())
@@ -1507,7 +1507,9 @@ def run_desktop(args, desktop_mode: str) -> int:
         clone_node(url, node_branch, clone_root, log_prefix="[desktop]")
         workflows_dir = clone_root / node_name / "workflows"
         if workflows_dir.is_dir():
-            workflow_names = sorted(p.stem for p in workflows_dir.glob("*.json"))
+            with os.scandir(workflows_dir) as it:
+                workflow_names = sorted(
+                    e.name[:-5] for e in it if e.name.endswith(".json") and e.is_file())
         # Capture HEAD SHA so cdp_driver can write it as commit_hash in
         # results.json. Manager installs from main, so this is the SHA the
         # test actually ran against -- the dashboard compares it against
@@ -1640,9 +1642,8 @@ def run_desktop(args, desktop_mode: str) -> int:
         path = _resolve_comfy_log()
         deadline = time.time() + 600
         while path is None or not path.exists():
-            if _comfy_tail_stop.is_set() or time.time() > deadline:
+            if time.time() > deadline or _comfy_tail_stop.wait(2):
                 return
-            time.sleep(2)
             path = _resolve_comfy_log()
         try:
             with open(path, "r", encoding="utf-8", errors="replace") as f:
@@ -1650,7 +1651,9 @@ def run_desktop(args, desktop_mode: str) -> int:
                 while not _comfy_tail_stop.is_set():
                     line = f.readline()
                     if not line:
-                        time.sleep(0.5)
+                        # Waiting on the stop event rather than sleeping
+                        # lets the tail exit as soon as the run ends.
+                        _comfy_tail_stop.wait(0.5)
                         continue
                     sys.stdout.write(f"[comfy] {line.rstrip()}\n")
         except Exception as e:
@@ -9,13 +9,6 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
 
-from ..comfyui.coverage import analyze_coverage
-
-
-def _safe(s) -> str:
-    """Sanitize for Windows cp1252 consoles (mirrors run.py)."""
-    return str(s).encode("ascii", errors="replace").decode("ascii")
-
 
 def _load_input_coverage(pack_dir: Path) -> Tuple[Dict[str, Dict[str, List[str]]], List[str]]:
     """Read [test.coverage.inputs] from the pack's comfy-test.toml, if any.
@@ -24,15 +17,14 @@ def _load_input_coverage(pack_dir: Path) -> Tuple[Dict[str, Dict[str, List[str]]
     section) means no input-value requirements, and a malformed declaration is
     reported as a warning rather than aborting the node-level report.
     """
-    from ..common.config_file import tomllib
+    from ..common.config_file import tomllib, _read_toml
     from ..common.config import CoverageConfig
 
     toml_path = pack_dir / "comfy-test.toml"
     if tomllib is None or not toml_path.exists():
         return {}, []
     try:
-        with open(toml_path, "rb") as f:
-            data = tomllib.load(f)
+        data = _read_toml(toml_path)
     except Exception as e:
         return {}, [f"comfy-test.toml: could not parse ({e})"]
     section = data.get("test", {}).get("coverage", {})
@@ -46,6 +38,17 @@ def _load_input_coverage(pack_dir: Path) -> Tuple[Dict[str, Dict[str, List[str]]
 
 def cmd_coverage(args) -> int:
     """Report workflow coverage of a node pack's registered nodes."""
+    from ..comfyui.coverage import analyze_coverage
+
+    # Node and workflow names are arbitrary UTF-8 while a Windows console is
+    # cp1252: substitute what the console can't show instead of raising
+    # UnicodeEncodeError mid-report (same as cmd_run).
+    for _stream in (sys.stdout, sys.stderr):
+        try:
+            _stream.reconfigure(errors="replace")
+        except (AttributeError, ValueError):
+            pass
+
     pack_dir = Path(args.path).resolve()
     if not pack_dir.is_dir():
         print(f"[comfy-test] Not a directory: {pack_dir}", file=sys.stderr)
@@ -82,28 +85,28 @@ def cmd_coverage(args) -> int:
         return 1 if (args.strict and (result.untested or missing_inputs)) else 0
 
     if not result.registered:
-        print(_safe(f"[comfy-test] No NODE_CLASS_MAPPINGS found under {result.pack_dir}"))
+        print(f"[comfy-test] No NODE_CLASS_MAPPINGS found under {result.pack_dir}")
         print("            Is this a custom node pack directory?")
         return 2
 
-    print(_safe(f"Node pack:  {result.pack_dir}"))
-    print(_safe(f"Workflows:  {result.workflows_dir} ({result.workflow_count} file(s))"))
+    print(f"Node pack:  {result.pack_dir}")
+    print(f"Workflows:  {result.workflows_dir} ({result.workflow_count} file(s))")
     print()
-    print(_safe(
+    print(
         f"Coverage:   {len(result.tested)}/{len(result.registered)} registered nodes "
         f"used in workflows ({result.coverage_pct:.0f}%)"
-    ))
+    )
     if result.dispatched:
-        print(_safe(
+        print(
             f"            ({len(result.dispatched)} of those credited via dispatcher "
             "backend-map tracing, not a direct workflow reference -- see -v)"
-        ))
+        )
     print()
 
     if result.untested:
-        print(_safe(f"UNTESTED ({len(result.untested)}) -- registered but in no workflow:"))
+        print(f"UNTESTED ({len(result.untested)}) -- registered but in no workflow:")
         for name in result.untested:
-            print(_safe(f"  - {name}"))
+            print(f"  - {name}")
     else:
         print("All registered nodes are referenced by at least one workflow.")
     print()
@@ -115,42 +118,42 @@ def cmd_coverage(args) -> int:
                 hits = result.input_hits.get(node_type, {}).get(input_name, {})
                 covered = [v for v in values if v in hits]
                 absent = [v for v in values if v not in hits]
-                print(_safe(
+                print(
                     f"  {node_type}.{input_name}: "
                     f"{len(covered)}/{len(values)} declared values"
-                ))
+                )
                 for v in absent:
-                    print(_safe(f"    - MISSING {v!r}"))
+                    print(f"    - MISSING {v!r}")
                 if args.verbose:
                     for v in covered:
-                        print(_safe(f"    + {v!r}  ->  {', '.join(hits[v])}"))
+                        print(f"    + {v!r}  ->  {', '.join(hits[v])}")
         print()
 
     if args.verbose and result.tested:
-        print(_safe(f"TESTED ({len(result.tested)}):"))
+        print(f"TESTED ({len(result.tested)}):")
         for name in result.tested:
             direct = result.used.get(name)
             if direct:
-                print(_safe(f"  + {name}  ->  {', '.join(direct)}"))
+                print(f"  + {name}  ->  {', '.join(direct)}")
             else:
                 via = ", ".join(result.dispatched.get(name, []))
-                print(_safe(f"  + {name}  ->  {via}  [dispatched]"))
+                print(f"  + {name}  ->  {via}  [dispatched]")
         print()
 
     if result.external:
-        print(_safe(
+        print(
             f"Note: {len(result.external)} workflow node type(s) are not registered by "
             "this pack (builtins or other packs):"
-        ))
+        )
         for name in sorted(result.external):
             files = ", ".join(result.used.get(name, []))
-            print(_safe(f"  ? {name}  ({files})"))
+            print(f"  ? {name}  ({files})")
         print()
 
     if result.warnings:
-        print(_safe(f"Warnings ({len(result.warnings)}):"))
+        print(f"Warnings ({len(result.warnings)}):")
         for w in result.warnings:
-            print(_safe(f"  ! {w}"))
+            print(f"  ! {w}")
         print()
 
     return 1 if (args.strict and (result.untested or missing_inputs)) else 0
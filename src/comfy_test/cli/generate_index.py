@@ -9,13 +9,6 @@ over `reporting.html_report`, not logic of its own.
 
 from pathlib import Path
 
-from comfy_test.reporting.html_report import (
-    PLATFORMS,
-    generate_html_report,
-    generate_root_index,
-    generate_branch_root_index,
-)
-
 
 def cmd_generate_index(args) -> int:
     """Render the gh-pages index tree.
@@ -25,6 +18,13 @@ def cmd_generate_index(args) -> int:
       <root>/<branch>/index.html             branch index (platform tabs)
       <root>/index.html                      root index (branch switcher)
     """
+    from comfy_test.reporting.html_report import (
+        PLATFORMS,
+        generate_html_report,
+        generate_root_index,
+        generate_branch_root_index,
+    )
+
     root = Path(args.output_dir)
     if not root.exists():
         print(f"Error: Directory does not exist: {root}")
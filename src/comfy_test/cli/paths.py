@@ -1,5 +1,6 @@
 """Paths command for comfy-test CLI."""
 
+import functools
 import os
 import subprocess
 import sys
@@ -10,19 +11,40 @@ from pathlib import Path
 ENV_LOGS_DIR = "COMFY_TEST_LOGS_DIR"
 ENV_WORKSPACE_DIR = "COMFY_TEST_WORKSPACE_DIR"
 
-# Defaults
-DEFAULT_LOGS_DIR = Path.home() / "comfy-test-logs"
-DEFAULT_WORKSPACE_DIR = Path.home() / "test_workspaces"
+# Defaults, resolved against the home directory on first use (PEP 562) so
+# importing this module doesn't touch $HOME / the passwd database.
+_DEFAULT_DIR_NAMES = {
+    "DEFAULT_LOGS_DIR": "comfy-test-logs",
+    "DEFAULT_WORKSPACE_DIR": "test_workspaces",
+}
+
+
+@functools.cache
+def _default_dir(name: str) -> Path:
+    return Path.home() / _DEFAULT_DIR_NAMES[name]
+
+
+def __getattr__(name: str):
+    if name not in _DEFAULT_DIR_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _default_dir(name)
+
+
+@functools.lru_cache(maxsize=8)
+def _env_dir(value: str | None, default: str) -> Path:
+    # Keyed on the env var's current value, so the setup wizard (which
+    # exports new values into os.environ) never sees a stale path.
+    return _default_dir(default) if value is None else Path(value)
 
 
 def get_logs_dir() -> Path:
     """Get logs directory from env var or default."""
-    return Path(os.environ.get(ENV_LOGS_DIR, DEFAULT_LOGS_DIR))
+    return _env_dir(os.environ.get(ENV_LOGS_DIR), "DEFAULT_LOGS_DIR")
 
 
 def get_workspace_dir() -> Path:
     """Get workspace directory from env var or default."""
-    return Path(os.environ.get(ENV_WORKSPACE_DIR, DEFAULT_WORKSPACE_DIR))
+    return _env_dir(os.environ.get(ENV_WORKSPACE_DIR), "DEFAULT_WORKSPACE_DIR")
 
 
 def are_paths_configured() -> bool:
@@ -30,6 +52,7 @@ def are_paths_configured() -> bool:
     return ENV_LOGS_DIR in os.environ and ENV_WORKSPACE_DIR in os.environ
 
 
+@functools.cache
 def _detect_shell_config() -> Path:
     """Detect user's shell config file."""
     shell = os.environ.get("SHELL", "")
@@ -77,7 +100,7 @@ def run_setup_wizard() -> dict:
         logs_dir = _prompt_path(
             ENV_LOGS_DIR,
             "Where should test logs be saved?",
-            DEFAULT_LOGS_DIR,
+            _default_dir("DEFAULT_LOGS_DIR"),
         )
 
     # Get workspace dir
@@ -88,7 +111,7 @@ def run_setup_wizard() -> dict:
         workspace_dir = _prompt_path(
             ENV_WORKSPACE_DIR,
             "Where should test workspaces be created?",
-            DEFAULT_WORKSPACE_DIR,
+            _default_dir("DEFAULT_WORKSPACE_DIR"),
         )
 
     # Offer to persist these so the wizard doesn't run again next time.
@@ -152,11 +175,14 @@ export {ENV_WORKSPACE_DIR}="{workspace_dir}"
 """
 
     # Check if already present
-    if config_path.exists():
-        content = config_path.read_text()
-        if ENV_LOGS_DIR in content:
-            print(f"Warning: {ENV_LOGS_DIR} already in {config_path}, skipping")
-            return
+    try:
+        with config_path.open(encoding="utf-8", errors="replace") as f:
+            already = any(ENV_LOGS_DIR in line for line in f)
+    except FileNotFoundError:
+        already = False
+    if already:
+        print(f"Warning: {ENV_LOGS_DIR} already in {config_path}, skipping")
+        return
 
     # Append to file
     with open(config_path, "a") as f:
@@ -176,15 +202,15 @@ def cmd_paths(args) -> int:
     logs_set = ENV_LOGS_DIR in os.environ
     workspace_set = ENV_WORKSPACE_DIR in os.environ
 
-    print("Current paths:")
-    print(f"  {ENV_LOGS_DIR}:      {logs_dir}", end="")
-    print("" if logs_set else " (default - not set)")
-
-    print(f"  {ENV_WORKSPACE_DIR}: {workspace_dir}", end="")
-    print("" if workspace_set else " (default - not set)")
-
+    unset = " (default - not set)"
+    out = (
+        "Current paths:\n"
+        f"  {ENV_LOGS_DIR}:      {logs_dir}{'' if logs_set else unset}\n"
+        f"  {ENV_WORKSPACE_DIR}: {workspace_dir}{'' if workspace_set else unset}\n"
+    )
     if not logs_set or not workspace_set:
-        print(f"\nRun 'comfy-test paths --set' to configure")
+        out += "\nRun 'comfy-test paths --set' to configure\n"
+    sys.stdout.write(out)
 
     return 0
 
@@ -3,20 +3,46 @@
 import os
 import shutil
 import sys
-import tempfile
-from datetime import datetime
 from pathlib import Path
 
+# Only what the parser needs lives at module level: registering every
+# subcommand (`comfy-test --help`, typos) imports this module, so the run-time
+# helpers are imported inside cmd_run.
 from ..common.config import TestLevel
-from ..common.config_file import discover_config, load_config
-from ..common.errors import TestError, ConfigError
-from . import _nodelink
-from .paths import are_paths_configured, run_setup_wizard, get_workspace_dir, get_logs_dir
 
+# Accepted values for --level and COMFY_TEST_PLATFORM.
+_LEVEL_MAP = {level.value: level for level in TestLevel}
+_LEVEL_CHOICES = tuple(_LEVEL_MAP)
+_PLATFORM_CHOICES = frozenset({"linux", "macos", "windows", "windows_portable"})
 
-def _safe_str(s) -> str:
-    """Sanitize string for Windows cp1252 console encoding."""
-    return str(s).encode('ascii', errors='replace').decode('ascii')
+_SEP = "=" * 60
+
+
+def _discard_workspace(work_dir: Path) -> None:
+    """Move an old workspace aside and delete it in the background.
+
+    A populated workspace (venv, models, custom_nodes) can take minutes to
+    rmtree, on Windows especially. The rename is a single metadata update, so
+    --force returns at once; the thread is non-daemon so the delete still
+    completes before the interpreter exits.
+    """
+    import threading
+    import uuid
+
+    # uuid, not just the pid: a killed run can leave its .trash-* behind, and
+    # pids repeat across container runs (often 1).
+    trash = work_dir.with_name(f".trash-{work_dir.name}-{uuid.uuid4().hex}")
+    try:
+        os.replace(work_dir, trash)
+    except OSError:
+        # Can't move it aside (e.g. a file in it is held open on Windows):
+        # delete in place, as --force did before the background cleanup.
+        shutil.rmtree(work_dir)
+        return
+    threading.Thread(
+        target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True},
+        name="workspace-cleanup",
+    ).start()
 
 
 def get_current_platform() -> str:
@@ -34,11 +60,10 @@ def get_current_platform() -> str:
     """
     override = os.environ.get("COMFY_TEST_PLATFORM", "").strip().lower().replace("-", "_")
     if override:
-        valid = {"linux", "macos", "windows", "windows_portable"}
-        if override not in valid:
+        if override not in _PLATFORM_CHOICES:
             raise RuntimeError(
                 f"COMFY_TEST_PLATFORM={override!r} is not a platform "
-                f"(valid: {', '.join(sorted(valid))})")
+                f"(valid: {', '.join(sorted(_PLATFORM_CHOICES))})")
         if override.startswith("windows") and sys.platform != "win32":
             raise RuntimeError(
                 f"COMFY_TEST_PLATFORM={override!r} requires Windows "
@@ -75,7 +100,23 @@ def cmd_run(args) -> int:
     6. Run tests
     7. Output results to configured logs dir
     """
+    import tempfile
+    from datetime import datetime
+
+    from ..common.config_file import discover_config, load_config
+    from ..common.errors import TestError, ConfigError
     from ..orchestration.manager import TestManager
+    from . import _nodelink
+    from .paths import are_paths_configured, run_setup_wizard, get_workspace_dir, get_logs_dir
+
+    # Server output and error text are arbitrary UTF-8 while a Windows console
+    # is cp1252. Let the streams substitute unrepresentable characters instead
+    # of raising UnicodeEncodeError mid-report (same as run_desktop).
+    for _stream in (sys.stdout, sys.stderr):
+        try:
+            _stream.reconfigure(errors="replace")
+        except (AttributeError, ValueError):
+            pass
 
     # Validate flag combos against host OS -- we never run cross-platform tests
     host = sys.platform
@@ -161,43 +202,44 @@ def cmd_run(args) -> int:
     attach_mode = bool(getattr(args, "server_url", None))
 
     try:
+        # Load config first: a missing or invalid comfy-test.toml should fail
+        # before the interactive path wizard or any workspace/temp dir setup.
+        if args.config:
+            config = load_config(args.config)
+        else:
+            config = discover_config()
+
         # Check if paths are configured. Attach mode needs no workspace (the
         # CI workflow prebuilt the env), so never run the interactive wizard
         # there -- stdin is not a TTY in CI and input() would crash.
         if not attach_mode and not are_paths_configured():
             run_setup_wizard()
 
-        # Load config
-        if args.config:
-            config = load_config(args.config)
-        else:
-            config = discover_config()
-
-        timestamp = datetime.now().strftime("%H%M")
         short_name = node_dir.name.removeprefix("ComfyUI-")
+        # Names both the workspace and the logs subdirectory.
+        run_id = f"{short_name}-{datetime.now():%H%M}"
 
         if attach_mode:
             # No workspace: nothing is built. Scratch space only.
             work_dir = Path(tempfile.mkdtemp(prefix=f"comfy-test-attach-{short_name}-"))
         else:
-            # Create workspace directory
-            workspaces_dir = get_workspace_dir()
-            workspaces_dir.mkdir(exist_ok=True)
-
-            work_dir = workspaces_dir / f"{short_name}-{timestamp}"
-            if work_dir.exists():
+            # Create workspace directory (and the workspaces root on first use).
+            work_dir = get_workspace_dir() / run_id
+            # mkdir doubles as the existence check (one syscall, no race).
+            try:
+                work_dir.mkdir(parents=True)
+            except FileExistsError:
                 if not args.force:
                     print(f"Workspace already exists: {work_dir}", file=sys.stderr)
                     print("Use --force to overwrite.", file=sys.stderr)
                     return 1
-                shutil.rmtree(work_dir)
-            work_dir.mkdir()
+                _discard_workspace(work_dir)
+                work_dir.mkdir()
 
         print(f"[comfy-test] Workspace: {work_dir}")
 
-        # Create output directory in logs dir
+        # Output directory lives in the logs dir; created below, parents included.
         logs_dir = get_logs_dir()
-        logs_dir.mkdir(exist_ok=True)
 
         # Platform is always derived from the host OS -- we never run cross-platform.
         platform = get_current_platform()
@@ -205,7 +247,6 @@ def cmd_run(args) -> int:
             platform = "windows_portable"
 
         # Build output path: logs_dir/NodeName-XXXX/branch/platform-<backend>
-        run_id = f"{short_name}-{timestamp}"
         branch = getattr(args, 'branch', None)
         cuda = args.cuda or os.environ.get("COMFY_TEST_CUDA") == "1"
         # `cuda` is the "accelerator active?" bool. It also names the on-disk
@@ -239,7 +280,7 @@ def cmd_run(args) -> int:
         manager = TestManager(config, node_dir=node_dir, output_dir=output_dir)
 
         # Run tests
-        level = TestLevel(args.level) if args.level else None
+        level = _LEVEL_MAP[args.level] if args.level else None
         workflow_filter = getattr(args, 'workflow', None)
 
         novram = getattr(args, 'novram', False)
@@ -265,6 +306,11 @@ def cmd_run(args) -> int:
             except OSError:
                 pass
 
+        # --quiet: the exit code is the whole report (multi-step CI reads
+        # results.json / the logs dir, not stdout).
+        if getattr(args, "quiet", False):
+            return 0 if all(r.success for r in results) else 1
+
         # Report results
         flags = []
         if args.cuda:
@@ -280,18 +326,17 @@ def cmd_run(args) -> int:
         if workflow_filter:
             flags.append(f"--workflow={workflow_filter}")
         flag_suffix = f" ({', '.join(flags)})" if flags else ""
-        print(f"\n{'='*60}")
-        print(f"RESULTS{flag_suffix}")
-        print(f"{'='*60}")
+        # Collected and written in one go rather than a print() per line.
+        report = [f"\n{_SEP}\nRESULTS{flag_suffix}\n{_SEP}"]
 
         all_passed = True
         for result in results:
             status = "PASS" if result.success else "FAIL"
-            print(f"  {result.platform}: {status}")
+            report.append(f"  {result.platform}: {status}")
             if not result.success:
                 all_passed = False
                 if result.error:
-                    print(f"    Error: {_safe_str(result.error)}")
+                    report.append(f"    Error: {result.error}")
 
         # Per-workflow resource summary
         results_file = output_dir / "results.json"
@@ -304,7 +349,7 @@ def cmd_run(args) -> int:
                 header = f"\n  {'Workflow':<30s} {'Status':<9s} {'Time':<10s}"
                 header += " Peak VRAM  " if has_vram else ""
                 header += " Peak RAM"
-                print(header)
+                report.append(header)
                 total_duration = 0.0
                 for w in workflows:
                     name = w["name"] + ".json"
@@ -319,11 +364,12 @@ def cmd_run(args) -> int:
                         line += f" {vram:>5.2f} GB   " if vram is not None else "     -      "
                     ram = res.get("ram", {}).get("peak")
                     line += f" {ram:>5.2f} GB" if ram is not None else "    -"
-                    print(line)
+                    report.append(line)
                 total_mins, total_secs = divmod(int(total_duration), 60)
-                print(f"\n  Total execution time: {total_mins:02d}:{total_secs:02d}")
+                report.append(f"\n  Total execution time: {total_mins:02d}:{total_secs:02d}")
 
-        print(f"\nOutput: {output_dir}")
+        report.append(f"\nOutput: {output_dir}")
+        sys.stdout.write("\n".join(report) + "\n")
         return 0 if all_passed else 1
 
     except ConfigError as e:
@@ -358,7 +404,7 @@ def add_run_parser(subparsers):
     )
     run_parser.add_argument(
         "--level", "-l",
-        choices=[l.value for l in TestLevel],
+        choices=_LEVEL_CHOICES,
         help="Run only up to this level (overrides config)",
     )
     run_parser.add_argument(
@@ -426,6 +472,11 @@ def add_run_parser(subparsers):
              "(comfy-test.toml) -> common.config.DEFAULT_TORCH_VERSION. "
              "Also reads $COMFY_TEST_TORCH_VERSION as an override.",
     )
+    run_parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Don't print the results summary; report pass/fail via exit code only",
+    )
     run_parser.add_argument(
         "--vram-debug",
         action="store_true",
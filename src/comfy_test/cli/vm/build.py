@@ -19,7 +19,6 @@ from __future__ import annotations
 
 import os
 import secrets
-import string
 import sys
 from pathlib import Path
 from typing import Optional
@@ -568,7 +567,7 @@ def cmd_vm_build(args) -> int:
         assert resolved is not None  # validated at step 0
         return _provision_unattended(args, windows_iso, resolved, shared_unc)
 
-    print(_GUEST_CHECKLIST.format(vm_name=vm_name))
+    print(_GUEST_CHECKLIST.replace("{vm_name}", vm_name))
     return 0
 
 
@@ -1,9 +1,36 @@
 """ComfyUI server interaction utilities."""
 
-from .api import ComfyUIAPI
-from .models import WorkflowExecution
-from .server import ComfyUIServer
-from .workflow import WorkflowRunner
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .api import ComfyUIAPI
+    from .models import WorkflowExecution
+    from .server import ComfyUIServer
+    from .workflow import WorkflowRunner
+
+# Resolved on first access (PEP 562): the static submodules (coverage,
+# validator) must be importable without pulling in requests/websocket.
+_LAZY_EXPORTS = {
+    "ComfyUIAPI": ".api",
+    "ComfyUIServer": ".server",
+    "WorkflowExecution": ".models",
+    "WorkflowRunner": ".workflow",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "ComfyUIAPI",
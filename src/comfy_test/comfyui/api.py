@@ -11,6 +11,11 @@ import websocket
 from ..common.errors import ServerError, TestTimeoutError, VerificationError
 from .models import WorkflowExecution
 
+# Bounds (seconds) on how long execute_workflow waits on a silent WebSocket
+# before checking /history in case the completion message was missed.
+_WS_IDLE_WAIT_MIN = 5.0
+_WS_IDLE_WAIT_MAX = 20.0
+
 
 class ComfyUIAPI:
     """Client for ComfyUI REST API.
@@ -31,6 +36,8 @@ class ComfyUIAPI:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.session = requests.Session()
+        # Last /object_info this client fetched (see cached_object_info).
+        self._object_info: Optional[Dict[str, Any]] = None
 
     def health_check(self) -> bool:
         """Check if the server is responsive.
@@ -76,13 +83,28 @@ class ComfyUIAPI:
                 timeout=self.timeout,
             )
             response.raise_for_status()
-            return response.json()
+            self._object_info = response.json()
+            return self._object_info
         except requests.RequestException as e:
             raise ServerError(
                 "Failed to get object_info from ComfyUI",
                 str(e)
             )
 
+    def cached_object_info(self) -> Dict[str, Any]:
+        """The last /object_info this client fetched, fetching it if there is none.
+
+        The server's readiness wait ends on a full /object_info, so the first
+        caller after startup gets that payload instead of downloading it again.
+        """
+        if self._object_info is None:
+            return self.get_object_info()
+        return self._object_info
+
+    def forget_object_info(self) -> None:
+        """Drop the cached /object_info so the next cached_object_info() refetches."""
+        self._object_info = None
+
     def verify_nodes(self, expected_nodes: List[str]) -> None:
         """Verify that expected nodes are registered.
 
@@ -316,6 +338,10 @@ class ComfyUIAPI:
             log(f"Queued with ID: {prompt_id}")
 
             start_time = time.time()
+            # How long recv() may sit idle before we fall back to checking
+            # history. Doubles while the socket stays quiet (a long node can
+            # run for minutes without a message) and resets on any message.
+            idle_wait = _WS_IDLE_WAIT_MIN
 
             while True:
                 elapsed = time.time() - start_time
@@ -328,7 +354,7 @@ class ComfyUIAPI:
                     )
 
                 # Set socket timeout for this recv
-                ws.settimeout(min(5.0, timeout - elapsed))
+                ws.settimeout(min(idle_wait, timeout - elapsed))
 
                 try:
                     message_data = ws.recv()
@@ -341,7 +367,9 @@ class ComfyUIAPI:
                         log("Execution complete (detected via history fallback)")
                         execution.outputs = history.get("outputs", {})
                         break
+                    idle_wait = min(idle_wait * 2, _WS_IDLE_WAIT_MAX)
                     continue
+                idle_wait = _WS_IDLE_WAIT_MIN
 
                 if not isinstance(message_data, str):
                     # Binary data (e.g., preview images), skip
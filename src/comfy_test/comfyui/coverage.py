@@ -50,6 +50,7 @@ could auto-derive values when a schema's options list is a static literal.
 
 import ast
 import json
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
@@ -197,6 +198,44 @@ def _dict_comp_class_name_keys(
     return keys
 
 
+# Parsed modules keyed by (path, mtime_ns, size): discover_registered_nodes and
+# discover_backend_maps each walk every source file of the pack, and
+# analyze_coverage calls both.
+_AST_CACHE: Dict[Tuple[str, int, int], Tuple[Optional[ast.Module], Optional[str]]] = {}
+
+
+def _pack_sources(pack_dir: Path) -> List[Tuple[str, Optional[ast.Module], Optional[str]]]:
+    """Parse the pack's .py files, skipping _SKIP_DIRS.
+
+    Returns ``(relative path, tree, None)`` per file, or ``(relative path, None,
+    error class name)`` when the file could not be parsed. Skipped directories
+    are pruned from the walk rather than filtered afterwards, so a pack's
+    .venv or .git is never descended into.
+    """
+    paths: List[Path] = []
+    for root, dirs, names in os.walk(pack_dir):
+        dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+        paths.extend(Path(root, n) for n in names if n.endswith(".py"))
+
+    out = []
+    for py in sorted(paths):
+        rel = str(py.relative_to(pack_dir))
+        try:
+            st = py.stat()
+        except OSError:
+            continue
+        key = (str(py), st.st_mtime_ns, st.st_size)
+        entry = _AST_CACHE.get(key)
+        if entry is None:
+            try:
+                entry = (ast.parse(py.read_text(encoding="utf-8"), filename=rel), None)
+            except (SyntaxError, UnicodeDecodeError) as e:
+                entry = (None, e.__class__.__name__)
+            _AST_CACHE[key] = entry
+        out.append((rel, *entry))
+    return out
+
+
 def discover_registered_nodes(pack_dir: Path) -> Tuple[Set[str], List[str]]:
     """Statically collect every registered node type name in a pack.
 
@@ -212,14 +251,9 @@ def discover_registered_nodes(pack_dir: Path) -> Tuple[Set[str], List[str]]:
     found: Set[str] = set()
     warnings: List[str] = []
 
-    for py in sorted(pack_dir.rglob("*.py")):
-        if any(part in _SKIP_DIRS for part in py.relative_to(pack_dir).parts):
-            continue
-        rel = str(py.relative_to(pack_dir))
-        try:
-            tree = ast.parse(py.read_text(encoding="utf-8"), filename=rel)
-        except (SyntaxError, UnicodeDecodeError) as e:
-            warnings.append(f"{rel}: could not parse ({e.__class__.__name__})")
+    for rel, tree, error in _pack_sources(pack_dir):
+        if tree is None:
+            warnings.append(f"{rel}: could not parse ({error})")
             continue
 
         for node in ast.walk(tree):
@@ -323,13 +357,8 @@ def discover_backend_maps(pack_dir: Path) -> Tuple[Dict[str, Dict[str, str]], Li
     backend_maps: Dict[str, Dict[str, str]] = {}
     warnings: List[str] = []
 
-    for py in sorted(pack_dir.rglob("*.py")):
-        if any(part in _SKIP_DIRS for part in py.relative_to(pack_dir).parts):
-            continue
-        rel = str(py.relative_to(pack_dir))
-        try:
-            tree = ast.parse(py.read_text(encoding="utf-8"), filename=rel)
-        except (SyntaxError, UnicodeDecodeError):
+    for rel, tree, _error in _pack_sources(pack_dir):
+        if tree is None:
             continue
 
         for node in ast.walk(tree):
@@ -488,7 +517,11 @@ def discover_workflow_nodes(
     if not workflows_dir.is_dir():
         return {}, {}, {}, 0, [f"no workflows/ directory at {workflows_dir}"]
 
-    for wf in sorted(workflows_dir.glob("*.json")):
+    with os.scandir(workflows_dir) as it:
+        workflow_files = sorted(
+            Path(e.path) for e in it if e.name.endswith(".json") and e.is_file())
+
+    for wf in workflow_files:
         count += 1
         try:
             data = json.loads(wf.read_text(encoding="utf-8-sig"))
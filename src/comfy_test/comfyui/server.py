@@ -1,10 +1,13 @@
 """ComfyUI server management."""
 
+import re
+import socket
 import subprocess
 import threading
 import time
+from collections import deque
 from pathlib import Path
-from typing import Optional, Callable, List, TYPE_CHECKING
+from typing import Deque, Optional, Callable, List, Tuple, TYPE_CHECKING
 
 from .api import ComfyUIAPI
 from ..common.errors import ServerError, TestTimeoutError
@@ -13,6 +16,57 @@ if TYPE_CHECKING:
     from ..common.base_platform import TestPaths, TestPlatform
     from ..common.config import TestConfig
 
+# Prepended to every relayed server output line.
+_LINE_PREFIX = "  [ComfyUI] "
+
+# Server output lines kept for the crash report. The full stream already goes
+# to the log callback (and the session log), so only the tail is retained.
+_OUTPUT_TAIL_LINES = 50
+
+# Upper bound on the backoff between health probes while the server starts.
+_READY_POLL_MAX_DELAY = 1.0
+
+# Upper bound on the backoff between /object_info polls while nodes load.
+_NODE_POLL_MAX_DELAY = 2.0
+
+# Nodes count as loaded once a built-in node is registered and the node count
+# has not changed for this long (a pack still importing can hold the count
+# for a poll interval or two, not for seconds).
+_NODE_SETTLE_SECONDS = 3.0
+_BUILTIN_NODE = "KSampler"
+
+# Capacity requested for the server's output pipes (Linux). 1 MiB is the
+# default /proc/sys/fs/pipe-max-size, so it needs no privileges.
+_PIPE_SIZE = 1 << 20
+
+
+def _widen_pipes(process: subprocess.Popen) -> None:
+    """Grow the server's stdout/stderr pipes so output bursts don't stall it.
+
+    ComfyUI writes its startup log in bursts; with the default 64 KiB pipe
+    the child blocks in write() whenever the reader threads fall behind.
+    No-op where F_SETPIPE_SZ doesn't exist (Windows, macOS).
+    """
+    try:
+        import fcntl
+        set_size = fcntl.F_SETPIPE_SZ
+    except (ImportError, AttributeError):
+        return
+    for stream in (process.stdout, process.stderr):
+        if stream is None:
+            continue
+        try:
+            fcntl.fcntl(stream.fileno(), set_size, _PIPE_SIZE)
+        except OSError:
+            pass
+
+
+def _free_port() -> int:
+    """Return a currently unused loopback port assigned by the OS."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
 
 class ComfyUIServer:
     """Manages ComfyUI server lifecycle.
@@ -48,22 +102,26 @@ class ComfyUIServer:
         self.platform = platform
         self.paths = paths
         self.config = config
-        # Use random port to avoid conflicts with user's regular ComfyUI (8188)
+        # Let the OS pick a free port: never the user's regular ComfyUI (8188),
+        # and parallel runs can't collide the way a small random range did.
         if port is None:
-            import random
-            port = random.randint(41880, 41899)
+            port = _free_port()
         self.port = port
         self.cuda_mock_packages = cuda_mock_packages or []
         self.env_vars = env_vars or {}
         self.novram = novram
         self.vram_debug = vram_debug
         self._log = log_callback or (lambda msg: print(msg))
-        self._extra_log_listeners: List[Callable[[str], None]] = []
+        # Replaced, never mutated, so the reader threads iterate it per line
+        # without copying or racing add/remove.
+        self._extra_log_listeners: Tuple[Callable[[str], None], ...] = ()
         self._process: Optional[subprocess.Popen] = None
         self._api: Optional[ComfyUIAPI] = None
         self._output_thread: Optional[threading.Thread] = None
         self._stop_output_thread = False
-        self._output_lines: List[str] = []  # Captured server output
+        self._output_lines: Deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+        self._import_errors: List[str] = []  # Matched as lines arrive
+        self._output_lock = threading.Lock()  # stdout and stderr readers both append
 
     @property
     def base_url(self) -> str:
@@ -77,12 +135,13 @@ class ComfyUIServer:
 
     def add_log_listener(self, callback: Callable[[str], None]) -> None:
         """Add an extra log listener for server output."""
-        self._extra_log_listeners.append(callback)
+        self._extra_log_listeners += (callback,)
 
     def remove_log_listener(self, callback: Callable[[str], None]) -> None:
         """Remove an extra log listener."""
-        if callback in self._extra_log_listeners:
-            self._extra_log_listeners.remove(callback)
+        self._extra_log_listeners = tuple(
+            cb for cb in self._extra_log_listeners if cb != callback
+        )
 
     def _log_all(self, msg: str) -> None:
         """Log to main callback and all extra listeners."""
@@ -90,6 +149,15 @@ class ComfyUIServer:
         for listener in self._extra_log_listeners:
             listener(msg)
 
+    def _capture(self, line_text: str) -> None:
+        """Record a server output line and forward it to the log listeners."""
+        is_import_error = _IMPORT_ERROR_RE.search(line_text) is not None
+        with self._output_lock:
+            self._output_lines.append(line_text)
+            if is_import_error:
+                self._import_errors.append(line_text)
+        self._log_all(_LINE_PREFIX + line_text)
+
     def start(self, wait_timeout: int = 600) -> None:
         """Start the ComfyUI server and wait for it to be ready.
 
@@ -136,6 +204,7 @@ class ComfyUIServer:
             extra_env=extra_env,
             extra_args=extra_args,
         )
+        _widen_pipes(self._process)
 
         # Start output reader thread
         self._stop_output_thread = False
@@ -169,9 +238,7 @@ class ComfyUIServer:
                     if self._stop_output_thread:
                         break
                     if line:
-                        line_text = line.rstrip()
-                        self._output_lines.append(line_text)
-                        self._log_all(f"  [ComfyUI] {line_text}")
+                        self._capture(line.rstrip())
             except Exception as exc:
                 self._log_all(f"  [ComfyUI:{name}] reader thread died: {exc!r}")
 
@@ -181,19 +248,15 @@ class ComfyUIServer:
         stdout_thread.start()
         stderr_thread.start()
 
-        # Wait for process to end or stop signal
-        while not self._stop_output_thread:
-            if self._process.poll() is not None:
-                # Give threads a moment to finish reading
-                stdout_thread.join(timeout=1)
-                stderr_thread.join(timeout=1)
-                break
-            time.sleep(0.1)
+        # The readers end at EOF (process exit) or on the next line after a
+        # stop request; block on them rather than waking up to poll.
+        stdout_thread.join()
+        stderr_thread.join()
 
     def _tail_log_file(self, log_path: Path) -> None:
         """Tail a server log file written by the platform (used when stdout/stderr are redirected)."""
-        deadline = time.time() + 5
-        while not log_path.exists() and time.time() < deadline:
+        deadline = time.monotonic() + 5
+        while not log_path.exists() and time.monotonic() < deadline:
             if self._stop_output_thread:
                 return
             time.sleep(0.1)
@@ -206,16 +269,12 @@ class ComfyUIServer:
                 while not self._stop_output_thread:
                     line = fh.readline()
                     if line:
-                        line_text = line.rstrip()
-                        self._output_lines.append(line_text)
-                        self._log_all(f"  [ComfyUI] {line_text}")
+                        self._capture(line.rstrip())
                         continue
                     if self._process.poll() is not None:
                         # Drain anything written between our last read and exit.
                         for remaining in fh:
-                            line_text = remaining.rstrip()
-                            self._output_lines.append(line_text)
-                            self._log_all(f"  [ComfyUI] {line_text}")
+                            self._capture(remaining.rstrip())
                         return
                     time.sleep(0.1)
         except Exception as exc:
@@ -234,10 +293,10 @@ class ComfyUIServer:
         self._log(f"Waiting for server to be ready (timeout: {timeout}s)...")
         api = ComfyUIAPI(self.base_url, timeout=5)
 
-        start_time = time.time()
-        last_error = None
+        deadline = time.monotonic() + timeout
+        delay = 0.1
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             # Check if process died
             if self._process and self._process.poll() is not None:
                 # Let output thread finish reading remaining output
@@ -246,24 +305,34 @@ class ComfyUIServer:
                     self._output_thread.join(timeout=5)  # Give threads time to finish
 
                 # Include captured output in error for debugging
-                output_tail = "\n".join(self._output_lines[-50:]) if self._output_lines else "(no output captured)"
+                with self._output_lock:
+                    tail_lines = list(self._output_lines)
+                output_tail = "\n".join(tail_lines) if tail_lines else "(no output captured)"
                 raise ServerError(
                     "ComfyUI server exited unexpectedly",
-                    f"Exit code: {self._process.returncode}\n\nServer output (last 50 lines):\n{output_tail}"
+                    f"Exit code: {self._process.returncode}\n\n"
+                    f"Server output (last {_OUTPUT_TAIL_LINES} lines):\n{output_tail}"
                 )
 
             try:
                 if api.health_check():
                     # Wait for nodes to fully load (health check passes before nodes load)
                     self._log("Server responding, waiting for nodes to load...")
-                    time.sleep(20)
+                    self._wait_for_nodes_loaded(api, max(deadline - time.monotonic(), 0))
                     self._log("Server is ready!")
                     self._api = api
                     return
-            except Exception as e:
-                last_error = e
+            except Exception:
+                pass  # not up yet; retry until the deadline
 
-            time.sleep(1)
+            # Sleep by waiting on the process so a crash wakes us at once
+            # rather than on the next tick. Probe quickly at first (a warm
+            # start answers within a few hundred ms), backing off to 1s.
+            try:
+                self._process.wait(timeout=delay)
+            except subprocess.TimeoutExpired:
+                pass
+            delay = min(delay * 2, _READY_POLL_MAX_DELAY)
 
         # Timeout reached
         api.close()
@@ -272,6 +341,36 @@ class ComfyUIServer:
             timeout_seconds=timeout,
         )
 
+    def _wait_for_nodes_loaded(self, api: ComfyUIAPI, timeout: float) -> None:
+        """Poll /object_info until the node registry has settled.
+
+        The health check passes before custom nodes finish registering, so
+        wait until the built-in nodes are present and the node count has held
+        for _NODE_SETTLE_SECONDS. Backs off 0.25s -> 2s between polls; gives
+        up silently when the timeout runs out or the process exits. The last
+        poll's payload stays cached on ``api`` (see cached_object_info).
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.25
+        last_count = -1
+        settled_since = time.monotonic()
+        while time.monotonic() < deadline:
+            if self._process and self._process.poll() is not None:
+                return
+            try:
+                object_info = api.get_object_info()
+            except Exception:
+                object_info = {}
+            count = len(object_info) if _BUILTIN_NODE in object_info else -1
+            now = time.monotonic()
+            if count != last_count:
+                last_count = count
+                settled_since = now
+            elif count > 0 and now - settled_since >= _NODE_SETTLE_SECONDS:
+                return
+            time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+            delay = min(delay * 2, _NODE_POLL_MAX_DELAY)
+
     def stop(self) -> None:
         """Stop the ComfyUI server."""
         if self._process is None:
@@ -308,13 +407,14 @@ class ComfyUIServer:
     def get_import_errors(self) -> List[str]:
         """Get list of import errors from server startup logs.
 
-        Parses server output for "Cannot import" error messages that indicate
-        custom node import failures.
+        "Cannot import" / "IMPORT FAILED" lines indicating custom node import
+        failures, collected by the output readers as the lines arrive.
 
         Returns:
             List of error messages (empty if no errors)
         """
-        return scan_import_errors(self._output_lines)
+        with self._output_lock:
+            return self._import_errors[:]
 
     def __enter__(self) -> "ComfyUIServer":
         self.start()
@@ -324,20 +424,18 @@ class ComfyUIServer:
         self.stop()
 
 
+# ComfyUI logs import errors like:
+#   "Cannot import <module_path> module for custom nodes: <error>"
+# and lists failed packs in its import-times summary as "(IMPORT FAILED)".
+_IMPORT_ERROR_RE = re.compile(r"Cannot import.*module for custom nodes|IMPORT FAILED")
+
+
 def scan_import_errors(lines) -> List[str]:
     """Scan server-output lines for custom-node import failures.
 
     Shared by ComfyUIServer (in-memory output) and AttachedServer (log file).
     """
-    errors = []
-    for line in lines:
-        # ComfyUI logs import errors like:
-        # "Cannot import <module_path> module for custom nodes: <error>"
-        if "Cannot import" in line and "module for custom nodes" in line:
-            errors.append(line)
-        elif "IMPORT FAILED" in line:
-            errors.append(line)
-    return errors
+    return list(filter(_IMPORT_ERROR_RE.search, lines))
 
 
 class AttachedServer:
@@ -362,14 +460,15 @@ class AttachedServer:
         self.pid = None  # external process; resource monitors treat None as "skip"
         self._log = log_callback or (lambda msg: print(msg))
         self._log_file = Path(log_file) if log_file else None
-        self._listeners: List[Callable[[str], None]] = []
-        self._output_lines: List[str] = []
+        self._listeners: Tuple[Callable[[str], None], ...] = ()
+        self._import_errors: List[str] = []
         self._tail_pos = 0
         self._stop_tail = False
         self._tail_thread: Optional[threading.Thread] = None
+        self._api: Optional[ComfyUIAPI] = None
         if self._log_file and self._log_file.exists():
             text = self._log_file.read_text(encoding="utf-8", errors="replace")
-            self._output_lines = text.splitlines()
+            self._import_errors = scan_import_errors(text.splitlines())
             self._tail_pos = len(text)
             self._tail_thread = threading.Thread(target=self._tail, daemon=True)
             self._tail_thread.start()
@@ -381,9 +480,11 @@ class AttachedServer:
                     f.seek(self._tail_pos)
                     chunk = f.read()
                     self._tail_pos = f.tell()
+                listeners = self._listeners
                 for line in chunk.splitlines():
-                    self._output_lines.append(line)
-                    for cb in list(self._listeners):
+                    if _IMPORT_ERROR_RE.search(line):
+                        self._import_errors.append(line)
+                    for cb in listeners:
                         try:
                             cb(line)
                         except Exception:
@@ -393,19 +494,25 @@ class AttachedServer:
             time.sleep(0.5)
 
     def add_log_listener(self, callback: Callable[[str], None]) -> None:
-        self._listeners.append(callback)
+        self._listeners += (callback,)
 
     def remove_log_listener(self, callback: Callable[[str], None]) -> None:
-        if callback in self._listeners:
-            self._listeners.remove(callback)
+        self._listeners = tuple(cb for cb in self._listeners if cb != callback)
 
     def get_api(self) -> ComfyUIAPI:
-        return ComfyUIAPI(self.base_url)
+        # One client for the whole run so every level shares its keep-alive
+        # connection pool instead of opening a fresh session each time.
+        if self._api is None:
+            self._api = ComfyUIAPI(self.base_url)
+        return self._api
 
     def get_import_errors(self) -> List[str]:
-        return scan_import_errors(self._output_lines)
+        return self._import_errors[:]
 
     def stop(self) -> None:
         self._stop_tail = True
         if self._tail_thread:
             self._tail_thread.join(timeout=2)
+        if self._api:
+            self._api.close()
+            self._api = None
@@ -1,14 +1,18 @@
 """Workflow validation for ComfyUI workflows."""
 
+import functools
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError:
-    """A single validation error."""
+    """A single validation error.
+
+    Slotted: a broken install can produce one per node per workflow.
+    """
     node_id: int
     node_type: str
     message: str
@@ -29,6 +33,41 @@ class ValidationResult:
         return len(self.errors) == 0
 
 
+def _check_number(kind: str, cast, input_name: str, opts: Dict[str, Any], value: Any) -> Optional[str]:
+    # Match ComfyUI's runtime, which coerces numeric strings: the frontend
+    # sometimes serializes numeric widget values as strings (e.g. after manual
+    # editing) and the API accepts them via int(value) / float(value).
+    if isinstance(value, str):
+        try:
+            value = cast(value)
+        except ValueError:
+            return f"'{input_name}': expected {kind}, got non-numeric string {value!r}"
+    if not isinstance(value, (int, float)):
+        return f"'{input_name}': expected {kind}, got {type(value).__name__}"
+    min_val = opts.get("min")
+    max_val = opts.get("max")
+    if min_val is not None and value < min_val:
+        return f"'{input_name}': {value} < minimum {min_val}"
+    if max_val is not None and value > max_val:
+        return f"'{input_name}': {value} > maximum {max_val}"
+    return None
+
+
+def _check_type(kind: str, expected: type, input_name: str, opts: Dict[str, Any], value: Any) -> Optional[str]:
+    if not isinstance(value, expected):
+        return f"'{input_name}': expected {kind}, got {type(value).__name__}"
+    return None
+
+
+# Widget type -> check(input_name, opts, value) returning an error message or None.
+_SCALAR_CHECKS = {
+    "INT": functools.partial(_check_number, "INT", int),
+    "FLOAT": functools.partial(_check_number, "FLOAT", float),
+    "STRING": functools.partial(_check_type, "STRING", str),
+    "BOOLEAN": functools.partial(_check_type, "BOOLEAN", bool),
+}
+
+
 class WorkflowValidation:
     """Validates ComfyUI workflows against node schemas.
 
@@ -44,6 +83,12 @@ class WorkflowValidation:
             object_info: Node definitions from /object_info API
         """
         self.object_info = object_info
+        # node type -> its widget inputs, built on first use (see _widget_specs)
+        self._widget_spec_cache: Dict[str, List[Tuple[str, Any, Any, Optional[frozenset]]]] = {}
+        # "A,B, C" input type -> frozenset of its member types (see _accepted_types)
+        self._union_cache: Dict[str, frozenset] = {}
+        # node type -> its level 3 messages (see _introspection_messages)
+        self._introspection_cache: Dict[str, Tuple[str, ...]] = {}
 
     def validate(self, workflow: Dict[str, Any]) -> ValidationResult:
         """Run all validation levels on a workflow.
@@ -56,14 +101,37 @@ class WorkflowValidation:
         """
         result = ValidationResult()
 
-        # Level 1: Schema validation
-        result.errors.extend(self._validate_schema(workflow))
+        # Levels 1 and 3 are per-node, so they share one pass over the nodes
+        # (which also indexes them for level 2); errors are still reported
+        # level by level.
+        schema_errors: List[ValidationError] = []
+        introspection_errors: List[ValidationError] = []
+        nodes_by_id: Dict[Any, Dict[str, Any]] = {}
+
+        for node in workflow.get("nodes", []):
+            nodes_by_id[node.get("id")] = node
+            node_id = node.get("id", 0)
+            node_type = node.get("type", "unknown")
+
+            # Level 1: Schema validation
+            if node_type not in self.object_info:
+                schema_errors.append(ValidationError(
+                    node_id, node_type,
+                    f"Unknown node type: {node_type}",
+                    "schema"
+                ))
+                continue
+            schema_errors.extend(self._validate_widgets(node))
+
+            # Level 3: Node introspection
+            introspection_errors.extend(self._validate_introspection(node_id, node_type))
+
+        result.errors.extend(schema_errors)
 
         # Level 2: Graph validation
-        result.errors.extend(self._validate_graph(workflow))
+        result.errors.extend(self._validate_graph(workflow, nodes_by_id))
 
-        # Level 3: Node introspection
-        result.errors.extend(self._validate_introspection(workflow))
+        result.errors.extend(introspection_errors)
 
         return result
 
@@ -76,54 +144,33 @@ class WorkflowValidation:
         Returns:
             ValidationResult
         """
-        workflow_path = Path(workflow_path)
-        with open(workflow_path, encoding='utf-8-sig') as f:
-            workflow = json.load(f)
+        # Bytes in: json handles UTF-8 (with or without BOM) itself.
+        workflow = json.loads(Path(workflow_path).read_bytes())
         return self.validate(workflow)
 
-    def _validate_schema(self, workflow: Dict[str, Any]) -> List[ValidationError]:
-        """Level 1: Validate widget values against node schemas."""
-        errors = []
-
-        for node in workflow.get("nodes", []):
-            node_id = node.get("id", 0)
-            node_type = node.get("type", "unknown")
-
-            # Check node type exists
-            if node_type not in self.object_info:
-                errors.append(ValidationError(
-                    node_id, node_type,
-                    f"Unknown node type: {node_type}",
-                    "schema"
-                ))
-                continue
-
-            schema = self.object_info[node_type]
-            errors.extend(self._validate_widgets(node, schema))
-
-        return errors
-
     # Widget types that are uppercase but NOT connection types
     WIDGET_TYPES = {"BOOLEAN", "INT", "FLOAT", "STRING"}
 
-    def _validate_widgets(
-        self,
-        node: Dict[str, Any],
-        schema: Dict[str, Any]
-    ) -> List[ValidationError]:
-        """Validate widget values for a single node."""
-        errors = []
-        node_id = node.get("id", 0)
-        node_type = node.get("type", "unknown")
+    def _widget_specs(self, node_type: str) -> List[Tuple[str, Any, Any, Optional[frozenset]]]:
+        """(input_name, input_type, input_spec, allowed) for each widget of a node type.
 
-        inputs = schema.get("input", {})
+        In widgets_values order: required then optional, connection inputs
+        dropped. ``allowed`` is the enum's values as a frozenset (None for
+        non-enums, or enums with unhashable entries) so membership is one hash
+        probe rather than a scan of a model list that can run to hundreds of
+        entries. Built once per node type and reused for every node of that
+        type in every workflow this validator sees.
+        """
+        specs = self._widget_spec_cache.get(node_type)
+        if specs is not None:
+            return specs
+
+        inputs = self.object_info[node_type].get("input", {})
         required = inputs.get("required", {})
         optional = inputs.get("optional", {})
         all_inputs = {**required, **optional}
 
-        widgets_values = node.get("widgets_values", [])
-        widget_idx = 0
-
+        specs = []
         for input_name, input_spec in all_inputs.items():
             if not isinstance(input_spec, (list, tuple)) or len(input_spec) < 1:
                 continue
@@ -135,16 +182,36 @@ class WorkflowValidation:
             if isinstance(input_type, str) and input_type.isupper() and input_type not in self.WIDGET_TYPES:
                 continue
 
-            # This is a widget - get its value
-            if widget_idx >= len(widgets_values):
+            allowed = None
+            if isinstance(input_type, list):
+                try:
+                    allowed = frozenset(input_type)
+                except TypeError:
+                    pass
+
+            specs.append((input_name, input_type, input_spec, allowed))
+
+        self._widget_spec_cache[node_type] = specs
+        return specs
+
+    def _validate_widgets(self, node: Dict[str, Any]) -> List[ValidationError]:
+        """Level 1: Validate a node's widget values against its schema."""
+        errors = []
+        node_id = node.get("id", 0)
+        node_type = node.get("type", "unknown")
+
+        widgets_values = node.get("widgets_values", [])
+        num_values = len(widgets_values)
+
+        for widget_idx, (input_name, input_type, input_spec, allowed) in enumerate(self._widget_specs(node_type)):
+            if widget_idx >= num_values:
                 # No more widget values - might be using defaults
                 break
 
             value = widgets_values[widget_idx]
-            widget_idx += 1
 
             # Validate based on input type
-            error = self._validate_value(input_name, input_type, input_spec, value)
+            error = self._validate_value(input_name, input_type, input_spec, value, allowed)
             if error:
                 errors.append(ValidationError(node_id, node_type, error, "schema"))
 
@@ -155,10 +222,13 @@ class WorkflowValidation:
         input_name: str,
         input_type: Any,
         input_spec: List[Any],
-        value: Any
+        value: Any,
+        allowed: Optional[frozenset] = None
     ) -> Optional[str]:
         """Validate a single widget value against its spec.
 
+        ``allowed`` is the enum ``input_type`` as a frozenset, when available.
+
         Returns error message if invalid, None if valid.
         """
         # Get options dict (second element of spec, if present)
@@ -169,76 +239,37 @@ class WorkflowValidation:
             # Skip validation for file-based inputs (dynamic content)
             if opts.get("image_upload") or opts.get("file_upload"):
                 return None
-            if value not in input_type:
+            try:
+                known = value in allowed if allowed is not None else value in input_type
+            except TypeError:  # unhashable value (e.g. a list) against the set
+                known = value in input_type
+            if not known:
                 return f"'{input_name}': '{value}' not in allowed values {input_type}"
             return None
 
-        # INT validation -- match ComfyUI runtime which coerces numeric strings.
-        # ComfyUI's frontend sometimes serializes numeric widget values as
-        # strings (e.g. after manual editing); the API runtime accepts them
-        # via int(value), so this validator should too.
-        if input_type == "INT":
-            if isinstance(value, str):
-                try:
-                    value = int(value)
-                except ValueError:
-                    return f"'{input_name}': expected INT, got non-numeric string {value!r}"
-            if not isinstance(value, (int, float)):
-                return f"'{input_name}': expected INT, got {type(value).__name__}"
-            min_val = opts.get("min")
-            max_val = opts.get("max")
-            if min_val is not None and value < min_val:
-                return f"'{input_name}': {value} < minimum {min_val}"
-            if max_val is not None and value > max_val:
-                return f"'{input_name}': {value} > maximum {max_val}"
-
-        # FLOAT validation -- same coercion as INT above.
-        elif input_type == "FLOAT":
-            if isinstance(value, str):
-                try:
-                    value = float(value)
-                except ValueError:
-                    return f"'{input_name}': expected FLOAT, got non-numeric string {value!r}"
-            if not isinstance(value, (int, float)):
-                return f"'{input_name}': expected FLOAT, got {type(value).__name__}"
-            min_val = opts.get("min")
-            max_val = opts.get("max")
-            if min_val is not None and value < min_val:
-                return f"'{input_name}': {value} < minimum {min_val}"
-            if max_val is not None and value > max_val:
-                return f"'{input_name}': {value} > maximum {max_val}"
-
-        # STRING validation
-        elif input_type == "STRING":
-            if not isinstance(value, str):
-                return f"'{input_name}': expected STRING, got {type(value).__name__}"
-
-        # BOOLEAN validation
-        elif input_type == "BOOLEAN":
-            if not isinstance(value, bool):
-                return f"'{input_name}': expected BOOLEAN, got {type(value).__name__}"
+        check = _SCALAR_CHECKS.get(input_type) if isinstance(input_type, str) else None
+        return check(input_name, opts, value) if check is not None else None
 
-        return None
-
-    def _validate_graph(self, workflow: Dict[str, Any]) -> List[ValidationError]:
+    def _validate_graph(
+        self,
+        workflow: Dict[str, Any],
+        nodes_by_id: Dict[Any, Dict[str, Any]]
+    ) -> List[ValidationError]:
         """Level 2: Validate graph connections."""
         errors = []
 
-        nodes = workflow.get("nodes", [])
         links = workflow.get("links", [])
 
-        # Build node lookup
-        nodes_by_id = {n.get("id"): n for n in nodes}
-
         # Validate each link
         for link in links:
             if not isinstance(link, list) or len(link) < 6:
                 continue
 
-            link_id, from_node, from_slot, to_node, to_slot, link_type = link[:6]
+            link_id, from_node, from_slot, to_node, to_slot, _link_type = link[:6]
 
             # Check source node exists
-            if from_node not in nodes_by_id:
+            from_node_obj = nodes_by_id.get(from_node)
+            if from_node_obj is None:
                 errors.append(ValidationError(
                     from_node, "unknown",
                     f"Link {link_id}: source node {from_node} does not exist",
@@ -247,7 +278,8 @@ class WorkflowValidation:
                 continue
 
             # Check target node exists
-            if to_node not in nodes_by_id:
+            to_node_obj = nodes_by_id.get(to_node)
+            if to_node_obj is None:
                 errors.append(ValidationError(
                     to_node, "unknown",
                     f"Link {link_id}: target node {to_node} does not exist",
@@ -256,15 +288,13 @@ class WorkflowValidation:
                 continue
 
             # Validate connection types match
-            from_node_obj = nodes_by_id[from_node]
-            to_node_obj = nodes_by_id[to_node]
             from_type = from_node_obj.get("type", "unknown")
             to_type = to_node_obj.get("type", "unknown")
 
             # Check output type matches expected input type
             if from_type in self.object_info and to_type in self.object_info:
                 error = self._validate_connection(
-                    from_node_obj, from_slot, to_node_obj, to_slot, link_type
+                    from_type, from_slot, to_node_obj, to_type, to_slot
                 )
                 if error:
                     errors.append(ValidationError(
@@ -275,22 +305,18 @@ class WorkflowValidation:
 
     def _validate_connection(
         self,
-        from_node: Dict[str, Any],
+        from_type: str,
         from_slot: int,
         to_node: Dict[str, Any],
-        to_slot: int,
-        declared_type: str
+        to_type: str,
+        to_slot: int
     ) -> Optional[str]:
-        """Validate a single connection between nodes.
+        """Validate a single connection between nodes of known types.
 
         Returns error message if invalid, None if valid.
         """
-        from_type = from_node.get("type", "unknown")
-        to_type = to_node.get("type", "unknown")
-
         # Get output type from source node schema
-        from_schema = self.object_info.get(from_type, {})
-        from_outputs = from_schema.get("output", [])
+        from_outputs = self.object_info[from_type].get("output", [])
 
         if from_slot >= len(from_outputs):
             return f"Output slot {from_slot} does not exist on {from_type}"
@@ -317,86 +343,79 @@ class WorkflowValidation:
         if output_type == "*" or target_input_type == "*":
             return None
 
+        if output_type == target_input_type:
+            return None
+
         # Handle union types (comma-separated list of accepted types)
-        accepted_types = [t.strip() for t in target_input_type.split(",")]
-        if output_type not in accepted_types:
+        # (a non-string output, e.g. a COMBO's value list, never matches a name)
+        if not isinstance(output_type, str) or output_type not in self._accepted_types(target_input_type):
             return f"Type mismatch: {from_type} outputs {output_type}, but {to_type} expects {target_input_type}"
 
         return None
 
-    def _validate_introspection(self, workflow: Dict[str, Any]) -> List[ValidationError]:
-        """Level 3: Validate node introspection data from object_info.
-
-        Checks that each node in the workflow has valid:
+    def _accepted_types(self, input_type: str) -> frozenset:
+        """Member types of a union input type, parsed once per distinct string."""
+        accepted = self._union_cache.get(input_type)
+        if accepted is None:
+            accepted = frozenset(t.strip() for t in input_type.split(","))
+            self._union_cache[input_type] = accepted
+        return accepted
+
+    def _validate_introspection(self, node_id: int, node_type: str) -> List[ValidationError]:
+        """Level 3: Validate a known node type's introspection data from object_info."""
+        return [
+            ValidationError(node_id, node_type, message, "introspection")
+            for message in self._introspection_messages(node_type)
+        ]
+
+    def _introspection_messages(self, node_type: str) -> Tuple[str, ...]:
+        """Level 3 findings for a node type, checked once per type.
+
+        Checks that the node type has valid:
         - input: dict with required/optional structure
         - output: list of output types
         - output_name: list of output names (matching output length)
         - name: internal function name
         """
-        errors = []
+        messages = self._introspection_cache.get(node_type)
+        if messages is not None:
+            return messages
 
-        for node in workflow.get("nodes", []):
-            node_id = node.get("id", 0)
-            node_type = node.get("type", "unknown")
+        messages = ()
+        schema = self.object_info[node_type]
 
-            if node_type not in self.object_info:
-                # Already caught in Level 1
-                continue
-
-            schema = self.object_info[node_type]
-
-            # Check input structure
-            inputs = schema.get("input", {})
-            if not isinstance(inputs, dict):
-                errors.append(ValidationError(
-                    node_id, node_type,
-                    f"INPUT_TYPES returned invalid type: {type(inputs).__name__}",
-                    "introspection"
-                ))
-                continue
-
-            # Check required inputs have valid structure
-            required = inputs.get("required", {})
-            if required and not isinstance(required, dict):
-                errors.append(ValidationError(
-                    node_id, node_type,
-                    f"INPUT_TYPES 'required' is not a dict",
-                    "introspection"
-                ))
-
-            # Check optional inputs have valid structure
-            optional = inputs.get("optional", {})
-            if optional and not isinstance(optional, dict):
-                errors.append(ValidationError(
-                    node_id, node_type,
-                    f"INPUT_TYPES 'optional' is not a dict",
-                    "introspection"
-                ))
-
-            # Check output types
-            outputs = schema.get("output", [])
-            output_names = schema.get("output_name", [])
-
-            if not isinstance(outputs, list):
-                errors.append(ValidationError(
-                    node_id, node_type,
-                    f"RETURN_TYPES is not a list: {type(outputs).__name__}",
-                    "introspection"
-                ))
-            elif output_names and len(outputs) != len(output_names):
-                errors.append(ValidationError(
-                    node_id, node_type,
-                    f"RETURN_TYPES ({len(outputs)}) doesn't match RETURN_NAMES ({len(output_names)})",
-                    "introspection"
-                ))
+        # Check input structure
+        inputs = schema.get("input", {})
+        if not isinstance(inputs, dict):
+            messages = (f"INPUT_TYPES returned invalid type: {type(inputs).__name__}",)
+            self._introspection_cache[node_type] = messages
+            return messages
 
-            # Check function name exists
-            func_name = schema.get("name")
-            if not func_name:
-                errors.append(ValidationError(
-                    node_id, node_type,
-                    f"Node has no FUNCTION defined",
-                    "introspection"
-                ))
+        # Check required inputs have valid structure
+        required = inputs.get("required", {})
+        if required and not isinstance(required, dict):
+            messages += ("INPUT_TYPES 'required' is not a dict",)
 
-        return errors
+        # Check optional inputs have valid structure
+        optional = inputs.get("optional", {})
+        if optional and not isinstance(optional, dict):
+            messages += ("INPUT_TYPES 'optional' is not a dict",)
+
+        # Check output types
+        outputs = schema.get("output", [])
+        output_names = schema.get("output_name", [])
+
+        if not isinstance(outputs, list):
+            messages += (f"RETURN_TYPES is not a list: {type(outputs).__name__}",)
+        elif output_names and len(outputs) != len(output_names):
+            messages += (
+                f"RETURN_TYPES ({len(outputs)}) doesn't match RETURN_NAMES ({len(output_names)})",
+            )
+
+        # Check function name exists
+        func_name = schema.get("name")
+        if not func_name:
+            messages += ("Node has no FUNCTION defined",)
+
+        self._introspection_cache[node_type] = messages
+        return messages
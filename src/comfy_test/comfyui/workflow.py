@@ -64,6 +64,16 @@ class WorkflowRunner:
         self.api = api
         self._log = log_callback or (lambda msg: print(msg))
 
+    def invalidate_object_info(self) -> None:
+        """Drop the cached /object_info so the next conversion refetches it."""
+        self.api.forget_object_info()
+
+    def _get_object_info(self) -> Dict[str, Any]:
+        # /object_info only changes when the server restarts or reloads nodes,
+        # so the client's copy (usually the one the readiness wait ended on)
+        # serves every workflow this runner converts.
+        return self.api.cached_object_info()
+
     def run_workflow(
         self,
         workflow_file: Path,
@@ -89,8 +99,9 @@ class WorkflowRunner:
 
         # Load workflow
         self._log(f"Loading workflow from {workflow_file}...")
-        with open(workflow_file, "r", encoding='utf-8-sig') as f:
-            workflow_data = json.load(f)
+        # Bytes in: json detects the UTF-8 encoding and skips a BOM itself,
+        # without a TextIOWrapper decoding pass over multi-MB workflows.
+        workflow_data = json.loads(workflow_file.read_bytes())
 
         # Extract the prompt (workflow definition)
         # Workflow files can have either just the prompt, or a full structure
@@ -99,8 +110,7 @@ class WorkflowRunner:
         elif is_litegraph_format(workflow_data):
             # Convert litegraph format (frontend save) to prompt format (API)
             self._log("Converting litegraph workflow to prompt format...")
-            object_info = self.api.get_object_info()
-            prompt = litegraph_to_prompt(workflow_data, object_info)
+            prompt = litegraph_to_prompt(workflow_data, self._get_object_info())
         else:
             prompt = workflow_data
 
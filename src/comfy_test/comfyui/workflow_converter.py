@@ -7,9 +7,8 @@ Adapted for comfy-test to use object_info from /object_info API endpoint
 instead of direct nodes.NODE_CLASS_MAPPINGS access.
 """
 
-import json
 import logging
-from typing import Dict, Any, List, Tuple, Optional, Union
+from typing import Dict, Any, List, Tuple, Optional
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -1,33 +1,87 @@
 """Shared utilities, base classes, and configuration."""
 
-from .config import (
-    TestConfig,
-    TestLevel,
-    WorkflowConfig,
-    PlatformTestConfig,
-    CoverageConfig,
-    PYTHON_VERSIONS,
-)
-from .config_file import (
-    load_config,
-    discover_config,
-    CONFIG_FILE_NAMES,
-)
-from .errors import (
-    TestError,
-    ConfigError,
-    SetupError,
-    ServerError,
-    VerificationError,
-    WorkflowError,
-    TestTimeoutError,
-    DownloadError,
-    WorkflowValidationError,
-    WorkflowExecutionError,
-)
-from .base_platform import TestPlatform, TestPaths
-from .resource_monitor import ResourceMonitor, ResourceSample
-from .comfy_env import get_node_reqs, get_env_vars, get_cuda_packages
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config import (
+        TestConfig,
+        TestLevel,
+        WorkflowConfig,
+        PlatformTestConfig,
+        CoverageConfig,
+        PYTHON_VERSIONS,
+    )
+    from .config_file import (
+        load_config,
+        discover_config,
+        CONFIG_FILE_NAMES,
+    )
+    from .errors import (
+        TestError,
+        ConfigError,
+        SetupError,
+        ServerError,
+        VerificationError,
+        WorkflowError,
+        TestTimeoutError,
+        DownloadError,
+        WorkflowValidationError,
+        WorkflowExecutionError,
+    )
+    from .base_platform import TestPlatform, TestPaths
+    from .resource_monitor import ResourceMonitor, ResourceSample
+    from .comfy_env import get_node_reqs, get_env_vars, get_cuda_packages
+
+# Resolved on first access (PEP 562): importing e.g. common.config for
+# TestLevel must not drag in config_file -> platforms -> requests.
+_LAZY_EXPORTS = {
+    # Config
+    "TestConfig": ".config",
+    "TestLevel": ".config",
+    "WorkflowConfig": ".config",
+    "PlatformTestConfig": ".config",
+    "CoverageConfig": ".config",
+    "PYTHON_VERSIONS": ".config",
+    "load_config": ".config_file",
+    "discover_config": ".config_file",
+    "CONFIG_FILE_NAMES": ".config_file",
+    # Errors
+    "TestError": ".errors",
+    "ConfigError": ".errors",
+    "SetupError": ".errors",
+    "ServerError": ".errors",
+    "VerificationError": ".errors",
+    "WorkflowError": ".errors",
+    "TestTimeoutError": ".errors",
+    "DownloadError": ".errors",
+    "WorkflowValidationError": ".errors",
+    "WorkflowExecutionError": ".errors",
+    # Platform
+    "TestPlatform": ".base_platform",
+    "TestPaths": ".base_platform",
+    # Monitoring
+    "ResourceMonitor": ".resource_monitor",
+    "ResourceSample": ".resource_monitor",
+    # ComfyEnv
+    "get_node_reqs": ".comfy_env",
+    "get_env_vars": ".comfy_env",
+    "get_cuda_packages": ".comfy_env",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Config
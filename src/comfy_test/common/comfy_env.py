@@ -1,13 +1,28 @@
-"""Utilities for reading comfy-env.toml configuration."""
+"""Utilities for reading comfy-env.toml configuration.
 
-import sys
+Files are parsed through config_file's mtime-keyed TOML cache: INSTALL reads
+the same node's comfy-env files for node reqs, env vars and CUDA packages, and
+INSTANTIATION reads the CUDA packages again.
+"""
+
+import os
 from pathlib import Path
 from typing import List, Tuple
 
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib
+from .config_file import _read_toml
+
+
+# Directories get_cuda_packages never descends into: caches, VCS metadata,
+# virtualenvs and ComfyUI-style data folders, which can hold gigabytes of
+# weights but never a comfy-env.toml. Dot-directories are skipped as well.
+_SKIP_DIRS = {
+    "__pycache__", "node_modules", "venv", "_env",
+    "models", "input", "output", "temp",
+}
+
+# comfy-env.toml lives at the node root or a few levels below it (one per
+# isolated sub-environment); nothing deeper is searched.
+_MAX_CONFIG_DEPTH = 4
 
 
 def get_node_reqs(node_dir: Path) -> List[Tuple[str, str]]:
@@ -21,12 +36,9 @@ def get_node_reqs(node_dir: Path) -> List[Tuple[str, str]]:
         List of (name, repo) tuples, e.g., [('GeometryPack', 'PozzettiAndrea/ComfyUI-GeometryPack')]
     """
     config_path = Path(node_dir) / "comfy-env-root.toml"
-    if not config_path.exists():
-        return []
-
     try:
-        config = tomllib.loads(config_path.read_text())
-    except Exception:
+        config = _read_toml(config_path)
+    except Exception:  # missing or malformed
         return []
 
     node_reqs = config.get("node_reqs", {})
@@ -64,12 +76,9 @@ def get_env_vars(node_dir: Path) -> dict:
         return {}
 
     config_path = Path(node_dir) / "comfy-env.toml"
-    if not config_path.exists():
-        return {}
-
     try:
-        config = tomllib.loads(config_path.read_text())
-    except Exception:
+        config = _read_toml(config_path)
+    except Exception:  # missing or malformed
         return {}
 
     env_vars = config.get("env_vars", {})
@@ -80,8 +89,9 @@ def get_cuda_packages(node_dir: Path) -> List[str]:
     """
     Read all comfy-env.toml files and return list of CUDA package names.
 
-    Searches recursively through the node directory for comfy-env.toml files
-    and extracts CUDA packages from [cuda].packages sections.
+    Searches the node directory (up to _MAX_CONFIG_DEPTH levels, pruning
+    _SKIP_DIRS and dot-directories) for comfy-env.toml files and extracts CUDA
+    packages from [cuda].packages sections.
 
     Args:
         node_dir: Path to the custom node directory
@@ -92,9 +102,9 @@ def get_cuda_packages(node_dir: Path) -> List[str]:
     cuda_packages = []
 
     # Search all comfy-env.toml files in the node tree (not just root)
-    for config_path in Path(node_dir).rglob("comfy-env.toml"):
+    for config_path in _find_configs(Path(node_dir)):
         try:
-            config = tomllib.loads(config_path.read_text())
+            config = _read_toml(config_path)
         except Exception:
             continue
 
@@ -108,3 +118,17 @@ def get_cuda_packages(node_dir: Path) -> List[str]:
                     cuda_packages.append(pkg.replace("-", "_"))
 
     return cuda_packages
+
+
+def _find_configs(node_dir: Path) -> List[Path]:
+    """Find comfy-env.toml files under node_dir, pruning the walk."""
+    found = []
+    base_depth = len(node_dir.parts)
+    for root, dirs, names in os.walk(node_dir):
+        if "comfy-env.toml" in names:
+            found.append(Path(root, "comfy-env.toml"))
+        if len(Path(root).parts) - base_depth >= _MAX_CONFIG_DEPTH:
+            dirs[:] = []
+        else:
+            dirs[:] = [d for d in dirs if d not in _SKIP_DIRS and not d.startswith(".")]
+    return found
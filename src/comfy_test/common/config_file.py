@@ -22,9 +22,10 @@ Example:
     screenshot = "all"
 """
 
+import os
 import sys
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
 # Use built-in tomllib (Python 3.11+) or tomli fallback
 if sys.version_info >= (3, 11):
@@ -44,9 +45,34 @@ from ..platforms.registry import resolve as _resolve_platform, allowed_tokens
 
 
 # Config file names to search for
-CONFIG_FILE_NAMES = [
+CONFIG_FILE_NAMES = (
     "comfy-test.toml",
-]
+)
+
+# Parsed TOML documents keyed by (real path, mtime_ns, size). Several callers in
+# one process read the same comfy-test.toml (cmd_run, `coverage` input
+# declarations); an edited file changes the key, so entries never go stale.
+_TOML_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
+def _read_toml(path: Path | str) -> Dict[str, Any]:
+    """Parse a TOML file, reusing the previous parse while the file is unchanged.
+
+    The returned dict is shared between callers and must be treated as
+    read-only.
+
+    Raises:
+        OSError: If the file cannot be read
+        tomllib.TOMLDecodeError: If the file is not valid TOML
+    """
+    st = os.stat(path)
+    key = (os.path.realpath(path), st.st_mtime_ns, st.st_size)
+    data = _TOML_CACHE.get(key)
+    if data is None:
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+        _TOML_CACHE[key] = data
+    return data
 
 
 def load_config(
@@ -86,8 +112,7 @@ def load_config(
     base_dir = Path(base_dir) if base_dir else path.resolve().parent
 
     try:
-        with open(path, "rb") as f:
-            data = tomllib.load(f)
+        data = _read_toml(path)
     except Exception as e:
         raise ConfigError(f"Failed to parse TOML file: {path}", str(e))
 
@@ -126,10 +151,9 @@ def discover_config(
     node_dir = Path(node_dir) if node_dir else Path.cwd()
     file_names = file_names or CONFIG_FILE_NAMES
 
-    for name in file_names:
-        config_path = node_dir / name
-        if config_path.exists():
-            return load_config(config_path, node_dir)
+    config_path = _find_config_file(node_dir, tuple(file_names))
+    if config_path is not None:
+        return load_config(config_path, node_dir)
 
     raise ConfigError(
         f"No config file found in {node_dir}",
@@ -138,6 +162,72 @@ def discover_config(
     )
 
 
+# Config files already located, keyed by (absolute node dir, candidate names).
+# A hit is re-checked with one stat before reuse instead of a directory scan.
+# Only hits are remembered: a miss must be re-checked so that creating
+# comfy-test.toml mid-process (e.g. after the error message) is picked up.
+_FOUND_CONFIGS: Dict[Tuple[str, Tuple[str, ...]], Path] = {}
+
+
+def _find_config_file(node_dir: Path, file_names: Tuple[str, ...]) -> Optional[Path]:
+    """Return the first existing config file in node_dir, or None."""
+    key = (os.path.abspath(node_dir), file_names)
+    config_path = _FOUND_CONFIGS.get(key)
+    if config_path is not None:
+        # One stat confirms the remembered file; if it was moved or deleted,
+        # forget it and search again so the caller still gets ConfigError.
+        if os.path.exists(config_path):
+            return config_path
+        del _FOUND_CONFIGS[key]
+    if len(file_names) == 1:
+        present = {file_names[0]} if os.path.exists(node_dir / file_names[0]) else set()
+    else:
+        # One directory read instead of a stat per candidate name.
+        try:
+            with os.scandir(node_dir) as it:
+                present = {e.name for e in it}
+        except OSError:
+            return None
+    for name in file_names:
+        if name in present:
+            candidate = node_dir / name
+            _FOUND_CONFIGS[key] = candidate
+            return candidate
+    return None
+
+
+# *.json listings per workflow directory, keyed by path and invalidated by the
+# directory's mtime (adding, removing or renaming a file bumps it).
+_WORKFLOW_LISTINGS: Dict[str, Tuple[int, List[Path]]] = {}
+
+
+def _list_workflow_files(directory: Path) -> List[Path]:
+    """Return the *.json files directly inside directory ([] if it is missing)."""
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        return []
+    key = str(directory)
+    cached = _WORKFLOW_LISTINGS.get(key)
+    if cached is None or cached[0] != mtime:
+        with os.scandir(directory) as it:
+            files = [Path(e.path) for e in it if e.name.endswith(".json") and e.is_file()]
+        cached = (mtime, files)
+        _WORKFLOW_LISTINGS[key] = cached
+    return list(cached[1])
+
+
+def clear_config_caches() -> None:
+    """Forget located config files, parsed TOML and workflow listings.
+
+    For test suites and long-lived callers that rewrite node directories
+    wholesale; the caches already notice ordinary edits on their own.
+    """
+    _FOUND_CONFIGS.clear()
+    _TOML_CACHE.clear()
+    _WORKFLOW_LISTINGS.clear()
+
+
 def _parse_config(data: Dict[str, Any], base_dir: Path) -> TestConfig:
     """
     Parse TOML data into TestConfig.
@@ -307,7 +397,7 @@ def _parse_config(data: Dict[str, Any], base_dir: Path) -> TestConfig:
                     "extra_pip_indices must be a list of index URL strings",
                     'e.g. extra_pip_indices = ["https://pypi.example.com/simple"]',
                 )
-            kwargs["extra_pip_indices"] = indices
+            kwargs["extra_pip_indices"] = list(indices)
         if custom_hook:
             kwargs["custom"] = custom_hook
 
@@ -356,11 +446,7 @@ def _parse_workflow_config(data: Dict[str, Any], base_dir: Path) -> WorkflowConf
 
     def _discover_all() -> list:
         """Discover all workflow JSONs from workflows/ and workflows/tests/."""
-        found = []
-        for d in (workflows_dir, dev_tests_dir):
-            if d.exists():
-                found.extend(d.glob("*.json"))
-        return sorted(found)
+        return sorted(_list_workflow_files(workflows_dir) + _list_workflow_files(dev_tests_dir))
 
     def _discover_filtered() -> list:
         """Discover workflows filtered by COMFY_TEST_RUN_CONSUMER / COMFY_TEST_RUN_DEV settings."""
@@ -368,10 +454,10 @@ def _parse_workflow_config(data: Dict[str, Any], base_dir: Path) -> WorkflowConf
         run_consumer = _is_on("COMFY_TEST_RUN_CONSUMER", GENERAL_DEFAULTS["COMFY_TEST_RUN_CONSUMER"])
         run_dev = _is_on("COMFY_TEST_RUN_DEV", GENERAL_DEFAULTS["COMFY_TEST_RUN_DEV"])
         found = []
-        if run_consumer and workflows_dir.exists():
-            found.extend(workflows_dir.glob("*.json"))
-        if run_dev and dev_tests_dir.exists():
-            found.extend(dev_tests_dir.glob("*.json"))
+        if run_consumer:
+            found.extend(_list_workflow_files(workflows_dir))
+        if run_dev:
+            found.extend(_list_workflow_files(dev_tests_dir))
         return sorted(found)
 
     def _resolve_in_dirs(filename: str) -> Path:
@@ -4,11 +4,16 @@ Tracks RAM and VRAM usage during workflow execution.
 """
 
 import platform
-import subprocess
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 
+# Re-walk the tracked process's descendants every this many samples. The walk
+# scans every process on the host; ComfyUI's process tree rarely changes, and a
+# vanished child forces an early refresh.
+_CHILDREN_REFRESH_SAMPLES = 10
+
 
 @dataclass
 class ResourceSample:
@@ -22,7 +27,13 @@ class ResourceSample:
 class ResourceMonitor:
     """Background thread that samples CPU/GPU/RAM at regular intervals."""
 
-    def __init__(self, interval: float = 1.0, monitor_cuda: bool = False, pid: int | None = None):
+    def __init__(
+        self,
+        interval: float = 1.0,
+        monitor_cuda: bool = False,
+        pid: int | None = None,
+        max_samples: int = 3600,
+    ):
         """Initialize resource monitor.
 
         Args:
@@ -30,22 +41,52 @@ class ResourceMonitor:
             monitor_cuda: Whether to monitor GPU usage (default: False)
             pid: Process ID to track RAM for. If set, tracks that process
                  (plus its children) instead of system-wide RAM.
+            max_samples: Samples kept for the timeline (default: 3600, an
+                 hour at 1s). Older samples are dropped; the summary's
+                 peak/avg still cover the whole run.
         """
         self.interval = interval
         self.monitor_cuda = monitor_cuda
         self.pid = pid
-        self.samples: list[ResourceSample] = []
+        self.max_samples = max_samples
+        self.samples: deque[ResourceSample] = deque(maxlen=max_samples)
         self._pids: set[int] = set()
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
         self._start_time: float = 0
+        self._reset_totals()
+
+    def _reset_totals(self) -> None:
+        # Running peak/sum per metric, updated as samples arrive so the
+        # summary needs no second pass over a long run's samples.
+        self._sample_count = 0
+        self._ram_peak = 0.0
+        self._ram_sum = 0.0
+        self._vram_peak: float | None = None
+        self._vram_sum = 0.0
+        self._vram_count = 0
+
+    def _record(self, sample: ResourceSample) -> None:
+        """Append a sample and fold it into the running totals."""
+        self.samples.append(sample)
+        self._sample_count += 1
+        self._ram_sum += sample.ram_gb
+        if self._sample_count == 1 or sample.ram_gb > self._ram_peak:
+            self._ram_peak = sample.ram_gb
+        vram = sample.vram_gb
+        if vram is not None:
+            self._vram_sum += vram
+            self._vram_count += 1
+            if self._vram_peak is None or vram > self._vram_peak:
+                self._vram_peak = vram
 
     def start(self):
         """Start monitoring in background thread."""
         self._stop_event.clear()
-        self.samples = []
+        self.samples = deque(maxlen=self.max_samples)
+        self._reset_totals()
         self._pids: set[int] = set()
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self._thread.start()
 
@@ -68,17 +109,29 @@ class ResourceMonitor:
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 proc = None
 
+        children: list = []
+        samples_until_refresh = 0
+        # Ticks are scheduled against the monotonic clock, so time spent
+        # sampling (the psutil walk, a vendor VRAM query) doesn't push every
+        # later sample back.
+        next_tick = time.monotonic()
+
         while not self._stop_event.is_set():
             ram_bytes = 0
             if proc:
                 try:
-                    children = proc.children(recursive=True)
-                    self._pids = {proc.pid} | {c.pid for c in children}
+                    if samples_until_refresh <= 0:
+                        children = proc.children(recursive=True)
+                        self._pids = {proc.pid} | {c.pid for c in children}
+                        samples_until_refresh = _CHILDREN_REFRESH_SAMPLES
+                    samples_until_refresh -= 1
                     ram_bytes = proc.memory_info().rss
                     for child in children:
                         try:
                             ram_bytes += child.memory_info().rss
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        except psutil.NoSuchProcess:
+                            samples_until_refresh = 0
+                        except psutil.AccessDenied:
                             pass
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     ram_bytes = 0
@@ -86,12 +139,20 @@ class ResourceMonitor:
                 ram_bytes = psutil.virtual_memory().used
 
             sample = ResourceSample(
-                timestamp=round(time.time() - self._start_time, 1),
+                timestamp=round(time.monotonic() - self._start_time, 1),
                 ram_gb=round(ram_bytes / (1024**3), 2),
                 vram_gb=self._get_gpu_vram_gb() if self.monitor_cuda else None,
             )
-            self.samples.append(sample)
-            self._stop_event.wait(self.interval)
+            self._record(sample)
+
+            next_tick += self.interval
+            remaining = next_tick - time.monotonic()
+            if remaining <= 0:
+                # Sampling overran the interval: sample again now and
+                # reschedule from here instead of bursting to catch up.
+                next_tick = time.monotonic()
+                remaining = 0
+            self._stop_event.wait(remaining)
 
     def _get_gpu_vram_gb(self) -> float | None:
         """Get GPU VRAM usage in GB via nvidia-smi.
@@ -139,18 +200,19 @@ class ResourceMonitor:
         if not self.samples:
             return {}
 
-        ram_vals = [s.ram_gb for s in self.samples]
-        vram_vals = [s.vram_gb for s in self.samples if s.vram_gb is not None]
-
+        n = self._sample_count
         total_ram_gb = round(psutil.virtual_memory().total / (1024**3), 1)
 
         summary = {
-            "ram": {"peak": max(ram_vals), "avg": round(sum(ram_vals) / len(ram_vals), 2)},
+            "ram": {"peak": self._ram_peak, "avg": round(self._ram_sum / n, 2)},
             "total_ram_gb": total_ram_gb,
-            "samples": len(self.samples),
+            "samples": n,
         }
-        if vram_vals:
-            summary["vram"] = {"peak": max(vram_vals), "avg": round(sum(vram_vals) / len(vram_vals), 2)}
+        if self._vram_count:
+            summary["vram"] = {
+                "peak": self._vram_peak,
+                "avg": round(self._vram_sum / self._vram_count, 2),
+            }
 
         timeline = [
             {"t": s.timestamp, "ram": s.ram_gb, "vram": s.vram_gb}
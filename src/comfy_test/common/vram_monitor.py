@@ -3,8 +3,8 @@
 Silently logs per-second VRAM samples to ~/vramlogs/ as CSV.
 Tracks peak VRAM per workflow across the entire process tree.
 """
-import subprocess
 import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -12,27 +12,24 @@ from typing import Optional
 
 VRAMLOGS_DIR = Path.home() / "vramlogs"
 
+# Flush the CSV every this many samples (and on stop) rather than per row, so
+# a tail -f stays at most this many seconds behind.
+_FLUSH_EVERY_SAMPLES = 10
+
 
 def _get_descendant_pids(root_pid: int) -> set[int]:
-    """Get all descendant PIDs of root_pid using pgrep (recursive BFS)."""
-    pids = {root_pid}
-    queue = [root_pid]
-    while queue:
-        parent = queue.pop()
-        try:
-            result = subprocess.run(
-                ["pgrep", "-P", str(parent)],
-                capture_output=True, text=True, timeout=5,
-            )
-            for line in result.stdout.strip().split("\n"):
-                if line.strip():
-                    child = int(line.strip())
-                    if child not in pids:
-                        pids.add(child)
-                        queue.append(child)
-        except (subprocess.TimeoutExpired, ValueError, OSError):
-            pass
-    return pids
+    """root_pid plus all its descendants.
+
+    psutil reads every process's parent once and walks the tree in memory,
+    where pgrep -P per tree level forked a process for each parent.
+    """
+    import psutil
+
+    try:
+        children = psutil.Process(root_pid).children(recursive=True)
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return {root_pid}
+    return {root_pid} | {c.pid for c in children}
 
 
 def _get_gpu_vram_per_pid() -> dict[int, int]:
@@ -77,6 +74,11 @@ class VramMonitor:
         self._total_mib = _get_gpu_total_vram()
         self._log_path: Optional[Path] = None
         self._log_file = None
+        self._unflushed = 0
+        # Local-time "YYYY-MM-DDTHH:MM:SS" for the last whole second sampled;
+        # only the milliseconds change between samples within a second.
+        self._ts_second = -1
+        self._ts_prefix = ""
 
     @property
     def peak_mib(self) -> int:
@@ -100,7 +102,7 @@ class VramMonitor:
         self._log_path = VRAMLOGS_DIR / f"{self._node_name}_{safe_wf}_{ts}.csv"
         self._log_file = open(self._log_path, "w")
         self._log_file.write("timestamp,tree_vram_mib,total_vram_mib,num_gpu_processes,peak_vram_mib\n")
-        self._log_file.flush()
+        self._unflushed = 0
 
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
@@ -140,6 +142,14 @@ class VramMonitor:
             self._peak_mib = tree_mib
 
         if self._log_file:
-            ts = datetime.now().isoformat(timespec="milliseconds")
+            now = time.time()
+            second = int(now)
+            if second != self._ts_second:
+                self._ts_second = second
+                self._ts_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+            ts = f"{self._ts_prefix}.{int((now - second) * 1000):03d}"
             self._log_file.write(f"{ts},{tree_mib},{self._total_mib},{num_procs},{self._peak_mib}\n")
-            self._log_file.flush()
+            self._unflushed += 1
+            if self._unflushed >= _FLUSH_EVERY_SAMPLES:
+                self._log_file.flush()
+                self._unflushed = 0
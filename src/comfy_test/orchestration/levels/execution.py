@@ -193,11 +193,13 @@ def run(ctx: LevelContext) -> LevelContext:
     logs_dir.mkdir(parents=True, exist_ok=True)
 
     hardware = get_hardware_info()
+    server_pid = getattr(ctx.server, 'pid', None)
 
     try:
         all_errors = []
 
         for idx, workflow_file in enumerate(workflows, 1):
+            stem = workflow_file.stem
             # Unload models and clear cache before each workflow
             # Skip workflows not configured for this runner type. Checked FIRST,
             # before free_memory and before registering the log listener:
@@ -208,7 +210,7 @@ def run(ctx: LevelContext) -> LevelContext:
             # announced up front; skips only appear in results.json.
             if allowed_workflows and workflow_file not in allowed_workflows:
                 results.append({
-                    "name": workflow_file.stem,
+                    "name": stem,
                     "status": "skipped",
                     "duration_seconds": 0,
                     "error": f"Not configured for {runner_type} runner",
@@ -228,14 +230,12 @@ def run(ctx: LevelContext) -> LevelContext:
             spinner = ProgressSpinner(workflow_file.name, idx, total_workflows)
             spinner.start()
 
-            is_cuda_test = os.environ.get("COMFY_TEST_CUDA") == "1"
-            server_pid = getattr(ctx.server, 'pid', None)
-            resource_monitor = ResourceMonitor(interval=1.0, monitor_cuda=is_cuda_test, pid=server_pid)
+            resource_monitor = ResourceMonitor(interval=1.0, monitor_cuda=is_cuda_runner, pid=server_pid)
             resource_monitor.start()
 
             try:
-                workflow_video_dir = videos_dir / workflow_file.stem
-                final_screenshot_path = screenshots_dir / f"{workflow_file.stem}_executed.png"
+                workflow_video_dir = videos_dir / stem
+                final_screenshot_path = screenshots_dir / f"{stem}_executed.png"
                 frames = ws.capture_execution_frames(
                     _resolve_workflow_path(ctx, workflow_file),
                     output_dir=workflow_video_dir,
@@ -270,7 +270,7 @@ def run(ctx: LevelContext) -> LevelContext:
 
                 # Save resource timeline to CSV
                 if resource_metrics.get("timeline"):
-                    csv_path = logs_dir / f"{workflow_file.stem}_resources.csv"
+                    csv_path = logs_dir / f"{stem}_resources.csv"
                     total_ram = resource_metrics.get("total_ram_gb", 16)
                     with open(csv_path, 'w', encoding='utf-8') as f:
                         f.write(f"# total_ram_gb={total_ram}\n")
@@ -281,7 +281,7 @@ def run(ctx: LevelContext) -> LevelContext:
                     resource_metrics.pop("timeline", None)
 
                 results.append({
-                    "name": workflow_file.stem,
+                    "name": stem,
                     "status": status,
                     "duration_seconds": round(duration, 2),
                     "error": error_msg,
@@ -290,10 +290,10 @@ def run(ctx: LevelContext) -> LevelContext:
                 })
 
                 # Save per-workflow log (always, even on failure)
-                (logs_dir / f"{workflow_file.stem}.log").write_text(
+                (logs_dir / f"{stem}.log").write_text(
                     "\n".join(current_workflow_log), encoding="utf-8"
                 )
-                ws.save_console_logs(logs_dir / f"{workflow_file.stem}_console.log")
+                ws.save_console_logs(logs_dir / f"{stem}_console.log")
                 ws.clear_console_logs()
 
                 # Unload models after each workflow to prevent OOM on limited VRAM GPUs
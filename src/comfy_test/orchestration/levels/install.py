@@ -149,8 +149,8 @@ def run(ctx: LevelContext) -> LevelContext:
 def _read_comfyui_version(comfyui_dir: Path) -> str | None:
     """Version from ComfyUI's pyproject.toml (works for git clones and the
     portable bundle, which ships the source tree without .git)."""
+    from ...common.config_file import tomllib
     try:
-        import tomllib
         with open(comfyui_dir / "pyproject.toml", "rb") as f:
             return tomllib.load(f).get("project", {}).get("version") or None
     except Exception:
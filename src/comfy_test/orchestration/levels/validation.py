@@ -48,12 +48,7 @@ def run(ctx: LevelContext) -> LevelContext:
         ctx.log(f"  [{idx}/{total_workflows}] Validating {workflow_file.name}")
 
         try:
-            # Load workflow JSON
-            with open(workflow_path, encoding='utf-8-sig') as f:
-                workflow = json.load(f)
-
-            # Run validation
-            result = validator.validate(workflow)
+            result = validator.validate_file(workflow_path)
 
             if result.is_valid:
                 ctx.log("    OK")
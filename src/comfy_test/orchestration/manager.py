@@ -3,9 +3,10 @@
 import faulthandler
 import os
 import shutil
+import threading
 import time
 from pathlib import Path
-from typing import Optional, Callable, List
+from typing import Optional, Callable, List, TextIO
 
 from ..common.config import TestConfig, TestLevel, ALL_LEVELS
 from ..common.errors import TestError
@@ -78,6 +79,8 @@ class TestManager:
         self._session_log: List[str] = []
         self._session_start_time: float = 0
         self._session_log_file: Optional[Path] = None
+        self._session_log_fh: Optional[TextIO] = None
+        self._session_log_lock = threading.Lock()
         self._level_index = 0
         self._total_levels = 0
 
@@ -98,15 +101,36 @@ class TestManager:
         self._original_log(msg)
         self._session_log.append(timestamped_msg)
 
-        if self._session_log_file:
+        # Written through one line-buffered handle held for the whole run:
+        # each line still reaches the OS immediately (so a killed or hung run
+        # keeps its log), without an open() + fsync() per line -- server
+        # output is routed through here and can be thousands of lines.
+        if self._session_log_fh is not None:
+            try:
+                with self._session_log_lock:
+                    self._session_log_fh.write(timestamped_msg + "\n")
+            except Exception:
+                pass
+        elif self._session_log_file:
             try:
                 with open(self._session_log_file, "a", encoding="utf-8") as f:
                     f.write(timestamped_msg + "\n")
-                    f.flush()
-                    os.fsync(f.fileno())
             except Exception:
                 pass
 
+    def _close_session_log(self) -> None:
+        """Flush the session log to disk and release the handle."""
+        with self._session_log_lock:
+            fh, self._session_log_fh = self._session_log_fh, None
+        if fh is None:
+            return
+        try:
+            fh.flush()
+            os.fsync(fh.fileno())
+        except Exception:
+            pass
+        fh.close()
+
     def _save_session_log(self) -> None:
         """Log completion message."""
         if self._session_log_file and self._session_log_file.exists():
@@ -248,7 +272,7 @@ class TestManager:
         output_base = self._get_output_base()
         output_base.mkdir(parents=True, exist_ok=True)
         self._session_log_file = output_base / "session.log"
-        self._session_log_file.write_text("", encoding="utf-8")
+        self._session_log_fh = open(self._session_log_file, "w", encoding="utf-8", buffering=1)
 
         # Copy the config that produced this run alongside its output, so it's
         # easy to see what config was used without checking the source repo.
@@ -312,4 +336,5 @@ class TestManager:
                 except Exception:
                     pass
             self._save_session_log()
+            self._close_session_log()
             crash_log_file.close()
@@ -3,7 +3,6 @@
 import json
 import os
 import platform
-import subprocess
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Optional, List
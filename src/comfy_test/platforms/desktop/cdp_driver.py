@@ -1443,14 +1443,15 @@ def _install_via_visible_shell(page, node_repo, node_branch,
             _console_append(page, f'  -> could not start: {e}\n\n')
             return 126
         buf = []
-        last_flush = time.time()
+        last_flush = time.monotonic()
         for line in proc.stdout:
             log(f'  install-shell:   | {line.rstrip()}')
             buf.append(line)
-            if time.time() - last_flush > 0.15:
+            now = time.monotonic()
+            if now - last_flush > 0.15:
                 _console_append(page, ''.join(buf))
                 buf.clear()
-                last_flush = time.time()
+                last_flush = now
         if buf:
             _console_append(page, ''.join(buf))
         rc = proc.wait()
@@ -21,6 +21,10 @@ import sys
 from pathlib import Path
 
 TS_RE = re.compile(r'^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3})\]')
+# Electron's rotated-session suffix (main.log_2026-05-08T04-06-22-280Z.log)
+ROTATED_RE = re.compile(r'\.log_\d{4}-')
+ROTATED_SUFFIX_RE = re.compile(r'\.log_\d{4}-.*$')
+PREV_SUFFIX_RE = re.compile(r'\.prev\d*$')
 
 SRC_TAG = {
     'main': 'MAI',
@@ -36,8 +40,8 @@ def _normalize_stem(name: str) -> str:
     s = name
     if s.endswith('.log'):
         s = s[:-4]
-    s = re.sub(r'\.log_\d{4}-.*$', '', s)
-    s = re.sub(r'\.prev\d*$', '', s)
+    s = ROTATED_SUFFIX_RE.sub('', s)
+    s = PREV_SUFFIX_RE.sub('', s)
     return s
 
 
@@ -56,26 +60,29 @@ def merge(logs_dir: Path) -> Path | None:
         # PowerShell prompt ANSI rendering. None of it is signal for
         # comfy-env / pixi / metadata-scan triage. Kill/restart events
         # the driver itself logs go to GHA stdout instead.
-        if _normalize_stem(f.name) == 'main':
+        stem = _normalize_stem(f.name)
+        if stem == 'main':
             continue
         # Skip rotated session logs (main.log_<ts>.log,
         # comfyui.log_<ts>.log, *.prev*.log) -- Electron rotates main.log
         # on each session boundary, so on a CI-driven Apply Changes restart
         # we'd otherwise slurp BOTH the prior session's rotated log AND
         # the current session's fresh log.
-        if re.search(r'\.log_\d{4}-', f.name) or '.prev' in f.name:
+        if ROTATED_RE.search(f.name) or '.prev' in f.name:
             continue
-        stem = _normalize_stem(f.name)
         tag = SRC_TAG.get(stem, stem[:3].upper().ljust(3))
+        # Stream the file: comfyui.log can run to many MB, and only the
+        # (timestamp, tag, line) tuples need to outlive this loop.
         try:
-            text = f.read_text(errors='replace')
+            with f.open(errors='replace') as fh:
+                for line in fh:
+                    line = line.rstrip('\n')
+                    m = TS_RE.match(line)
+                    if m:
+                        last_ts = m.group(1)
+                    events.append((last_ts, tag, line))
         except Exception:
             continue
-        for line in text.splitlines():
-            m = TS_RE.match(line)
-            if m:
-                last_ts = m.group(1)
-            events.append((last_ts, tag, line))
     if not events:
         return None
     events.sort(key=lambda e: e[0])
@@ -1,9 +1,10 @@
 """Download utilities for Windows Portable ComfyUI."""
 
-import os
+import json
 import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
 from typing import Optional, Callable
 
@@ -17,6 +18,9 @@ PORTABLE_RELEASE_URL = "https://github.com/comfyanonymous/ComfyUI/releases/downl
 PORTABLE_LATEST_URL = "https://github.com/comfyanonymous/ComfyUI/releases/latest/download/ComfyUI_windows_portable_nvidia.7z"
 PORTABLE_LATEST_API = "https://api.github.com/repos/comfyanonymous/ComfyUI/releases/latest"
 
+# How long a cached "latest" tag is trusted without asking GitHub again.
+LATEST_TAG_MAX_AGE = 3600
+
 
 def get_cache_dir() -> Path:
     """Get persistent cache directory for portable downloads."""
@@ -25,12 +29,38 @@ def get_cache_dir() -> Path:
     return cache_dir
 
 
+def _read_cached_tag() -> tuple[str, float] | None:
+    """(tag, fetched_at) from the latest-tag cache file, or None."""
+    try:
+        data = json.loads((get_cache_dir() / "latest-release.json").read_text())
+        return data["tag"], float(data["fetched_at"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cached_tag(tag: str) -> None:
+    try:
+        (get_cache_dir() / "latest-release.json").write_text(
+            json.dumps({"tag": tag, "fetched_at": time.time()}))
+    except OSError:
+        pass
+
+
 def get_latest_release_tag(log: Callable[[str], None]) -> str:
     """Get the latest release tag from GitHub API.
 
+    A tag fetched within LATEST_TAG_MAX_AGE is reused without a request. An
+    older cached tag is revalidated, but still used (with a warning) when
+    GitHub can't be reached, so offline re-runs keep working.
+
     Always unauthenticated -- the comfyanonymous/ComfyUI releases endpoint is public,
     and a stale GITHUB_TOKEN in the caller's env would cause 401s for no reason.
     """
+    cached = _read_cached_tag()
+    if cached is not None and time.time() - cached[1] < LATEST_TAG_MAX_AGE:
+        log(f"Latest version: {cached[0]} (cached)")
+        return cached[0]
+
     log("Fetching latest release version...")
 
     try:
@@ -41,8 +71,13 @@ def get_latest_release_tag(log: Callable[[str], None]) -> str:
         if not tag:
             raise DownloadError("No tag_name in release response")
         log(f"Latest version: {tag}")
+        _write_cached_tag(tag)
         return tag
     except requests.RequestException as e:
+        if cached is not None:
+            log(f"WARNING: could not refresh latest release ({type(e).__name__}); "
+                f"using cached {cached[0]}")
+            return cached[0]
         raise DownloadError(
             f"Failed to fetch latest release info ({type(e).__name__}: {e})",
             PORTABLE_LATEST_API
@@ -35,7 +35,7 @@ def _copy_tree_long_path(src: Path, dst: Path) -> None:
     shutil.copytree(src, dst)
 
 from ...common.base_platform import TestPlatform, TestPaths
-from ...common.errors import DownloadError, SetupError
+from ...common.errors import SetupError
 from .download import download_portable, get_latest_release_tag, extract_7z, get_cache_dir
 
 if TYPE_CHECKING:
@@ -45,6 +45,7 @@ if TYPE_CHECKING:
 def _gitignore_filter(base_dir: Path, work_dir: Path = None):
     """Create a shutil.copytree ignore function based on .gitignore patterns."""
     import fnmatch
+    import re
     from typing import List
 
     # Always ignore these (essential for clean copy)
@@ -62,6 +63,24 @@ def _gitignore_filter(base_dir: Path, work_dir: Path = None):
             pattern = line.rstrip('/')
             gitignore_patterns.append(pattern)
 
+    # All patterns as one regex, matched against each name and relative path
+    # instead of an fnmatch call per (entry, pattern) pair. normcase on both
+    # sides keeps fnmatch.fnmatch's case-insensitivity on Windows.
+    ignore_re = None
+    if gitignore_patterns:
+        ignore_re = re.compile("|".join(
+            fnmatch.translate(os.path.normcase(p)) for p in gitignore_patterns
+        ))
+
+    # Resolved once: copytree calls ignore_func for every directory it visits.
+    # An entry can only resolve to work_dir if it carries one of its names
+    # (as given or resolved) or is itself a symlink; only those are resolved.
+    work_dir_names = set()
+    if work_dir:
+        work_dir_names = {work_dir.name}
+        work_dir = work_dir.resolve()
+        work_dir_names.add(work_dir.name)
+
     def ignore_func(directory: str, names: List[str]) -> List[str]:
         ignored = []
         try:
@@ -74,26 +93,20 @@ def _gitignore_filter(base_dir: Path, work_dir: Path = None):
                 ignored.append(name)
                 continue
 
-            if work_dir:
-                full_path = Path(directory) / name
+            full_path = Path(directory) / name
+            if work_dir and (name in work_dir_names or full_path.is_symlink()):
                 try:
-                    if full_path.resolve() == work_dir.resolve():
+                    if full_path.resolve() == work_dir:
                         ignored.append(name)
                         continue
                 except (OSError, ValueError):
                     pass
 
-            rel_path = rel_dir / name
-            for pattern in gitignore_patterns:
-                if fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(str(rel_path), pattern):
-                    ignored.append(name)
-                    break
-                if pattern.endswith('/') and fnmatch.fnmatch(name, pattern[:-1]):
-                    ignored.append(name)
-                    break
-                if '*' in pattern and fnmatch.fnmatch(name, pattern):
-                    ignored.append(name)
-                    break
+            if ignore_re and (
+                ignore_re.match(os.path.normcase(name))
+                or ignore_re.match(os.path.normcase(str(rel_dir / name)))
+            ):
+                ignored.append(name)
 
         return ignored
 
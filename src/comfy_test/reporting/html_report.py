@@ -5,6 +5,7 @@ This module generates an index.html file from test results that can be:
 - Published to gh-pages for public visibility
 """
 
+import functools
 import html
 import json
 import os
@@ -25,8 +26,10 @@ from ..platforms.registry import gallery_platforms
 PLATFORMS = gallery_platforms()
 
 
+@functools.cache
 def _load_template(name: str) -> str:
-    """Load a template file from report_templates directory."""
+    """Load a template file from report_templates directory (once per process;
+    generate-index renders report.html for every platform dir it finds)."""
     return files("comfy_test.reporting.report_templates").joinpath(name).read_text()
 
 
@@ -136,6 +139,15 @@ def _get_system_info() -> dict:
     return info
 
 
+def _file_names(directory: Path, suffix: str) -> List[str]:
+    """Names of the files in directory ending with suffix ([] if it is missing)."""
+    try:
+        with os.scandir(directory) as it:
+            return [e.name for e in it if e.name.endswith(suffix) and e.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
 def generate_html_report(
     output_dir: Path,
     repo_name: Optional[str] = None,
@@ -162,10 +174,9 @@ def generate_html_report(
     results = json.loads(results_file.read_text(encoding='utf-8-sig'))
 
     # Discover available screenshots and logs
-    screenshots = {f.stem.replace("_executed", ""): f.name
-                   for f in screenshots_dir.glob("*.png")} if screenshots_dir.exists() else {}
-    log_files = {f.stem: f.name
-                 for f in logs_dir.glob("*.log")} if logs_dir.exists() else {}
+    screenshots = {name[:-4].replace("_executed", ""): name
+                   for name in _file_names(screenshots_dir, ".png")}
+    log_files = {name[:-4]: name for name in _file_names(logs_dir, ".log")}
 
     # Discover video metadata
     video_data: Dict[str, Any] = {}
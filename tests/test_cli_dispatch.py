@@ -0,0 +1,43 @@
+"""comfy-test's main() registers only the parser for the requested subcommand.
+
+Help, a missing command and typos must still see every subcommand, and the
+argparse-free answer to a bare `comfy-test` must match what argparse prints.
+"""
+
+import pytest
+
+from comfy_test import cli
+
+
+def _full_parser_error(monkeypatch, capsys, argv):
+    monkeypatch.setenv("COLUMNS", "200")  # keep argparse's usage on one line
+    with pytest.raises(SystemExit) as exc:
+        cli.main(argv)
+    assert exc.value.code == 2
+    return capsys.readouterr().err
+
+
+def test_bare_invocation_matches_argparse(monkeypatch, capsys):
+    assert cli.main([]) == 2
+    fast = capsys.readouterr().err
+    # An option-only argv takes the register-everything path, so argparse
+    # produces the same "command is required" error from the full parser.
+    full = _full_parser_error(monkeypatch, capsys, ["--"])
+    assert fast == full
+
+
+def test_unknown_command_lists_every_subcommand(monkeypatch, capsys):
+    err = _full_parser_error(monkeypatch, capsys, ["nope"])
+    assert "invalid choice: 'nope'" in err
+    for name in cli._REGISTRARS:
+        assert name in err
+
+
+def test_known_command_registers_only_its_parser(monkeypatch, capsys):
+    registered = []
+    real_register = cli._register
+    monkeypatch.setattr(cli, "_register",
+                        lambda name, sp: (registered.append(name), real_register(name, sp)))
+    assert cli.main(["paths"]) == 0
+    assert registered == ["paths"]
+    assert "Current paths:" in capsys.readouterr().out
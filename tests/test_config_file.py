@@ -0,0 +1,65 @@
+"""In-process caches in comfy_test.common.config_file.
+
+discover_config remembers where it found a config and load_config reuses the
+parsed TOML while the file is unchanged; these pin down when those caches are
+reused and when they must be dropped.
+"""
+
+import os
+
+import pytest
+
+from comfy_test.common.config_file import clear_config_caches, discover_config, load_config
+from comfy_test.common.errors import ConfigError
+
+
+@pytest.fixture
+def node_dir(tmp_path):
+    d = tmp_path / "ComfyUI-Example"
+    (d / "workflows").mkdir(parents=True)
+    (d / "comfy-test.toml").write_text('[test]\ncomfyui_version = "latest"\n')
+    clear_config_caches()
+    yield d
+    clear_config_caches()
+
+
+def test_located_config_skips_directory_scan(node_dir, monkeypatch):
+    names = ["comfy-test.local.toml", "comfy-test.toml"]
+    scans = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path="."):
+        if os.fspath(path) == os.fspath(node_dir):
+            scans.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    assert discover_config(node_dir, names).name == "ComfyUI-Example"
+    assert len(scans) == 1
+    assert discover_config(node_dir, names).name == "ComfyUI-Example"
+    assert len(scans) == 1
+
+
+def test_moved_config_raises_config_error(node_dir):
+    assert discover_config(node_dir).name == "ComfyUI-Example"
+    (node_dir / "comfy-test.toml").rename(node_dir / "moved.toml")
+    with pytest.raises(ConfigError):
+        discover_config(node_dir)
+    clear_config_caches()
+    with pytest.raises(ConfigError):
+        discover_config(node_dir)
+
+
+def test_edited_config_is_reparsed(node_dir):
+    path = node_dir / "comfy-test.toml"
+    assert load_config(path).comfyui_version == "latest"
+    path.write_text('[test]\ncomfyui_version = "v0.3.10"\n')
+    assert load_config(path).comfyui_version == "v0.3.10"
+
+
+def test_new_workflow_is_discovered(node_dir):
+    workflows = node_dir / "workflows"
+    (workflows / "a.json").write_text("{}")
+    assert [w.name for w in discover_config(node_dir).workflow.workflows] == ["a.json"]
+    (workflows / "b.json").write_text("{}")
+    assert [w.name for w in discover_config(node_dir).workflow.workflows] == ["a.json", "b.json"]
@@ -0,0 +1,122 @@
+"""WorkflowValidation against a small hand-written object_info.
+
+Covers the three levels (widget schema, graph links, introspection) so the
+validator's fast paths can be reworked without changing what it reports.
+"""
+
+import pytest
+
+from comfy_test.comfyui.validator import WorkflowValidation
+
+
+OBJECT_INFO = {
+    "Loader": {
+        "input": {"required": {"ckpt_name": [["a.safetensors", "b.safetensors"]]}},
+        "output": ["MODEL", "STRING"],
+        "output_name": ["MODEL", "NAME"],
+        "name": "load",
+    },
+    "Sampler": {
+        "input": {
+            "required": {
+                "model": ["MODEL"],
+                "steps": ["INT", {"min": 1, "max": 100}],
+                "cfg": ["FLOAT", {"min": 0.0, "max": 30.0}],
+            },
+            "optional": {
+                "label": ["STRING", {}],
+                "enabled": ["BOOLEAN", {}],
+                "image": [["x.png"], {"image_upload": True}],
+            },
+        },
+        "output": ["LATENT"],
+        "output_name": ["LATENT"],
+        "name": "sample",
+    },
+    "Broken": {
+        "input": {"required": {}},
+        "output": ["A", "B"],
+        "output_name": ["A"],
+        "name": "",
+    },
+}
+
+
+def _workflow(nodes, links=()):
+    return {"nodes": nodes, "links": [list(link) for link in links]}
+
+
+def _sampler(widgets, node_id=2, input_type="MODEL"):
+    return {"id": node_id, "type": "Sampler", "widgets_values": widgets,
+            "inputs": [{"name": "model", "type": input_type}]}
+
+
+@pytest.fixture
+def validator():
+    return WorkflowValidation(OBJECT_INFO)
+
+
+def _messages(result):
+    return [str(e) for e in result.errors]
+
+
+def test_valid_workflow_has_no_errors(validator):
+    wf = _workflow(
+        [{"id": 1, "type": "Loader", "widgets_values": ["a.safetensors"]},
+         _sampler([20, "7.5", "hi", True, "not-in-list.png"])],
+        [(1, 1, 0, 2, 0, "MODEL")],
+    )
+    assert _messages(validator.validate(wf)) == []
+
+
+@pytest.mark.parametrize("widgets, expected", [
+    ([0, 1.0], "'steps': 0 < minimum 1"),
+    ([5, 31], "'cfg': 31 > maximum 30.0"),
+    (["many", 1.0], "'steps': expected INT, got non-numeric string 'many'"),
+    ([5, 1.0, 3], "'label': expected STRING, got int"),
+    ([5, 1.0, "x", 1], "'enabled': expected BOOLEAN, got int"),
+])
+def test_widget_values_are_checked_in_order(validator, widgets, expected):
+    result = validator.validate(_workflow([_sampler(widgets)]))
+    assert _messages(result) == [f"[schema] Node 2 (Sampler): {expected}"]
+
+
+def test_enum_and_unknown_type(validator):
+    wf = _workflow([
+        {"id": 1, "type": "Loader", "widgets_values": ["c.safetensors"]},
+        {"id": 3, "type": "Missing"},
+    ])
+    assert _messages(validator.validate(wf)) == [
+        "[schema] Node 1 (Loader): 'ckpt_name': 'c.safetensors' not in allowed "
+        "values ['a.safetensors', 'b.safetensors']",
+        "[schema] Node 3 (Missing): Unknown node type: Missing",
+    ]
+
+
+def test_links_are_type_checked(validator):
+    loader = {"id": 1, "type": "Loader", "widgets_values": ["a.safetensors"]}
+    wf = _workflow(
+        [loader, _sampler([], input_type="MODEL"), _sampler([], node_id=4, input_type="CLIP, STRING")],
+        [(1, 1, 0, 2, 0, "MODEL"), (2, 1, 1, 4, 0, "STRING"), (3, 1, 5, 2, 0, "X"),
+         (4, 9, 0, 2, 0, "MODEL"), (5, 1, 0, 2, 3, "MODEL"), (6, 1, 0, 4, 0, "MODEL")],
+    )
+    assert _messages(validator.validate(wf)) == [
+        "[graph] Node 2 (Sampler): Output slot 5 does not exist on Loader",
+        "[graph] Node 9 (unknown): Link 4: source node 9 does not exist",
+        "[graph] Node 2 (Sampler): Input slot 3 does not exist on Sampler",
+        "[graph] Node 4 (Sampler): Type mismatch: Loader outputs MODEL, but "
+        "Sampler expects CLIP, STRING",
+    ]
+
+
+def test_introspection_problems_are_reported(validator):
+    result = validator.validate(_workflow([{"id": 5, "type": "Broken"}]))
+    assert _messages(result) == [
+        "[introspection] Node 5 (Broken): RETURN_TYPES (2) doesn't match RETURN_NAMES (1)",
+        "[introspection] Node 5 (Broken): Node has no FUNCTION defined",
+    ]
+
+
+def test_reused_validator_gives_the_same_answer(validator):
+    wf = _workflow([_sampler([0, 1.0])])
+    assert _messages(validator.validate(wf)) == _messages(validator.validate(wf))